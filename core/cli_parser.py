@@ -1,9 +1,39 @@
 # cli_parser.py
 
-import argparse
 from pathlib import Path
 
+# 파싱 결과 캐시 (여러 진입점에서 호출되어도 argparse를 한 번만 실행)
+_cached_args = None
+
+# 생성된 ArgumentParser 캐시 (한 번만 구성)
+_PARSER = None
+
+
 def parse_arguments():
+    global _cached_args
+    if _cached_args is None:
+        _cached_args = _do_parse()
+    return _cached_args
+
+
+def reset_args_cache():
+    """캐시된 파싱 결과를 초기화합니다 (테스트용)."""
+    global _cached_args
+    _cached_args = None
+
+
+def _do_parse():
+    return _get_parser().parse_args()
+
+
+def _get_parser():
+    global _PARSER
+    if _PARSER is not None:
+        return _PARSER
+
+    # argparse는 파서가 실제로 필요할 때만 임포트 (콜드 스타트 비용 절감)
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="GitHub 리포지토리 Secrets 및 Variables 관리 도구",
         formatter_class=argparse.RawTextHelpFormatter
@@ -59,8 +89,18 @@ def parse_arguments():
     parser.add_argument(
         "-w", "--workers",
         type=int,
-        default=1,
-        help="동시에 처리할 리포지토리 수 (기본값: 1, 즉 순차 처리)"
+        default=None,
+        help="동시에 처리할 리포지토리 수 (생략 시 CPU 수 기반 자동 설정, 1이면 순차 처리)"
+    )
+    parser.add_argument(
+        "--executor",
+        choices=["thread", "process"],
+        default="thread",
+        dest="executor",
+        help="""병렬 처리에 사용할 실행기 종류 (기본값: thread).
+thread: I/O 위주 작업에 적합 (gh/API 호출 대기가 대부분일 때).
+process: 암호화/JSON 파싱 등 CPU 작업이 많을 때 GIL을 우회합니다.
+(--workers가 2 이상일 때만 유효)"""
     )
     parser.add_argument(
         "-z", "--sleep",
@@ -80,5 +120,13 @@ def parse_arguments():
     )
     # --- 여기까지 ---
 
-    args = parser.parse_args()
-    return args
\ No newline at end of file
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        default=False,
+        dest="no_cache",
+        help="리포지토리 목록 조회 시 로컬 ETag 캐시를 사용하지 않고 항상 새로 가져옵니다."
+    )
+
+    _PARSER = parser
+    return parser
\ No newline at end of file
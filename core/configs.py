@@ -1,11 +1,12 @@
 from dataclasses import dataclass, field
 from pathlib import Path
-import threading
 
-@dataclass
+@dataclass(slots=True)
 class GitHubOperationConfig:
     """
     Data class to hold configuration information for GitHub repository Secrets and Variables operations.
+    Slotted so instances skip the per-instance __dict__ and attribute reads in
+    worker hot paths resolve through fixed slot offsets.
     """
     organization: str = field(default="") # GitHub organization or user name
     
@@ -17,6 +18,11 @@ class GitHubOperationConfig:
     delete_secrets: list = field(default_factory=list)
     delete_variables: list = field(default_factory=list)
 
+    # Set views of the deletion lists, built once so per-repo processing
+    # does not reconstruct them for every intersection.
+    delete_secrets_set: set = field(default_factory=set)
+    delete_variables_set: set = field(default_factory=set)
+
     # Target repositories list (read from file or fetched from GitHub)
     repositories: list[str] = field(default_factory=list) 
 
@@ -25,8 +31,15 @@ class GitHubOperationConfig:
     sleep_after_repo: int = 0 # Sleep duration (seconds) after processing each repository
     force: bool = False # Whether to overwrite Secrets/Variables if they already exist during setting
 
-    # stop_event for inter-thread communication (managed internally by the program)
-    stop_event: threading.Event = field(default_factory=threading.Event)
+    # Executor backend for parallel runs: "thread" (default, I/O-bound gh/API
+    # calls) or "process" (sidesteps the GIL when secret sealing and JSON
+    # parsing dominate; per-repo logs are shipped back from the children).
+    executor_kind: str = "thread"
+
+    # stop_event for inter-thread communication (managed internally by the program).
+    # Allocated lazily: single-worker runs never signal it, so readers must
+    # treat None as "no stop requested".
+    stop_event: "threading.Event | None" = None
 
     # Other file paths (can be assigned to this class instance after CLI argument parsing)
     secrets_file: Path | None = None
@@ -43,4 +56,18 @@ class GitHubOperationConfig:
         if self.max_workers < 1:
             raise ValueError("max_workers must be 1 or greater.")
         if self.sleep_after_repo < 0:
-            raise ValueError("sleep_after_repo must be 0 or greater.")
\ No newline at end of file
+            raise ValueError("sleep_after_repo must be 0 or greater.")
+        if self.executor_kind not in ("thread", "process"):
+            raise ValueError("executor_kind must be 'thread' or 'process'.")
+        if self.max_workers > 1 and self.stop_event is None:
+            import threading
+            self.stop_event = threading.Event()
+        self.rebuild_delete_sets()
+
+    def rebuild_delete_sets(self):
+        """
+        Rebuilds the set views of the deletion lists. Must be called again if
+        delete_secrets/delete_variables are assigned after construction.
+        """
+        self.delete_secrets_set = set(self.delete_secrets)
+        self.delete_variables_set = set(self.delete_variables)
\ No newline at end of file
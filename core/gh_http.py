@@ -0,0 +1,219 @@
+import base64
+import functools
+import random
+import threading
+import time
+
+# Optional HTTP dependencies. When unavailable, callers fall back to the gh CLI path.
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    from nacl import public
+    _HTTP_AVAILABLE = True
+except ImportError:
+    _HTTP_AVAILABLE = False
+
+from utils.utils import execute_subprocess_command
+from utils.logs import add_log_entry
+
+GITHUB_API_URL = "https://api.github.com"
+
+# Module-level session shared by all worker threads so each worker reuses
+# one kept-alive TCP+TLS connection instead of paying fork + TLS handshake
+# per secret/variable operation. Guarded by a lock for lazy construction.
+_session = None
+_session_lock = threading.Lock()
+_pool_size = 4  # Sized from config.max_workers via configure_pool_size()
+
+
+def is_available() -> bool:
+    """Returns True if the optional HTTP dependencies (requests, PyNaCl) are installed."""
+    return _HTTP_AVAILABLE
+
+
+def configure_pool_size(max_workers: int):
+    """
+    Sizes the connection pool of the shared session from the worker count.
+    Must be called before the first API request to take effect.
+    """
+    global _pool_size
+    _pool_size = max(max_workers, 1)
+
+
+def reset_after_fork():
+    """
+    Drops the shared session inside a forked worker process. A fork-started
+    child would otherwise reuse the parent's pooled sockets, interleaving
+    TLS traffic between processes; the child lazily builds its own session
+    on first use instead. The lock is replaced rather than acquired — an
+    inherited lock may have been held by a parent thread at fork time.
+    """
+    global _session, _session_lock
+    _session_lock = threading.Lock()
+    _session = None
+
+
+def _get_auth_token() -> str:
+    """
+    Reads the GitHub auth token once via the gh CLI.
+    The gh CLI is kept only for this; all API traffic goes over the shared session.
+    """
+    stdout_str, _ = execute_subprocess_command(['gh', 'auth', 'token'], False)
+    token = stdout_str.strip()
+    if not token:
+        raise RuntimeError("Could not obtain a GitHub token via 'gh auth token'. Run 'gh auth login' first.")
+    return token
+
+
+def get_session() -> "requests.Session":
+    """
+    Returns the shared authenticated session, building it on first use.
+
+    The session is configured with connection pooling sized for the worker
+    count and automatic retries with backoff on rate-limit/server errors.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                retry = Retry(
+                    total=5,
+                    backoff_factor=1,
+                    # 403 is deliberately absent: GitHub uses it for both
+                    # throttling and permission/SAML failures, and urllib3
+                    # cannot tell them apart. Secondary-rate-limit 403s are
+                    # retried in _api_request, which can inspect the response.
+                    status_forcelist=[429, 502, 503],
+                    allowed_methods=frozenset(['GET', 'PUT', 'POST', 'PATCH', 'DELETE']),
+                )
+                adapter = HTTPAdapter(
+                    pool_connections=_pool_size,
+                    pool_maxsize=_pool_size * 4,
+                    max_retries=retry,
+                )
+                session.mount("https://", adapter)
+                session.headers['Authorization'] = f"Bearer {_get_auth_token()}"
+                session.headers['Accept'] = "application/vnd.github+json"
+                session.headers['X-GitHub-Api-Version'] = "2022-11-28"
+                _session = session
+    return _session
+
+
+# Bounds for the secondary-rate-limit retry loop in _api_request.
+_SECONDARY_LIMIT_MAX_RETRIES = 5
+_SECONDARY_LIMIT_MAX_WAIT = 60  # seconds
+
+
+def _is_secondary_rate_limit(response: "requests.Response") -> bool:
+    """
+    Returns True if a 403 response is a secondary rate limit rather than a
+    permission/SAML failure. GitHub marks throttling 403s with a Retry-After
+    header or a 'secondary rate limit' message body; plain permission 403s
+    carry neither and must not be retried.
+    """
+    if response.status_code != 403:
+        return False
+    if 'Retry-After' in response.headers:
+        return True
+    return 'secondary rate limit' in response.text.lower()
+
+
+def _api_request(method: str, path: str, **kwargs) -> "requests.Response":
+    """
+    Issues an API request over the shared session.
+
+    Secondary rate limits (403 with Retry-After or a 'secondary rate limit'
+    body) are retried here with a bounded attempt count, honoring Retry-After
+    when present — mirroring the backoff the CLI path gets in run_gh_command.
+    The urllib3 Retry on the session cannot do this, because retrying every
+    403 would also retry hopeless permission/SAML failures.
+
+    Args:
+        method (str): The HTTP method (e.g., 'GET', 'PUT', 'DELETE').
+        path (str): The API path starting with '/' (e.g., '/repos/owner/repo/actions/variables').
+
+    Returns:
+        requests.Response: The raw response object (status not yet checked).
+    """
+    session = get_session()
+    for attempt in range(_SECONDARY_LIMIT_MAX_RETRIES + 1):
+        response = session.request(method, f"{GITHUB_API_URL}{path}", timeout=30, **kwargs)
+        if attempt >= _SECONDARY_LIMIT_MAX_RETRIES or not _is_secondary_rate_limit(response):
+            return response
+        try:
+            delay = min(_SECONDARY_LIMIT_MAX_WAIT, float(response.headers['Retry-After']))
+        except (KeyError, ValueError):
+            delay = min(_SECONDARY_LIMIT_MAX_WAIT, 2 ** attempt) + random.uniform(0, 1)
+        add_log_entry(None, f"⏳ Secondary rate limit hit on {method} {path}. Retrying in {delay:.1f}s (attempt {attempt + 1}/{_SECONDARY_LIMIT_MAX_RETRIES})...")
+        time.sleep(delay)
+    return response
+
+
+@functools.lru_cache(maxsize=4096)
+def _get_repo_public_key(repo_name: str) -> tuple[str, bytes]:
+    """
+    Fetches the repository public key used to encrypt secret values.
+    Cached for the lifetime of the process: the key is stable per repo, so
+    setting N secrets on one repo costs a single key fetch instead of N.
+
+    Returns:
+        tuple[str, bytes]: A tuple of (key_id, decoded public key bytes).
+    """
+    response = _api_request('GET', f"/repos/{repo_name}/actions/secrets/public-key")
+    response.raise_for_status()
+    data = response.json()
+    return data['key_id'], base64.b64decode(data['key'])
+
+
+def set_secret(repo_name: str, secret_name: str, secret_value: str):
+    """
+    Sets/updates a Secret via the REST API.
+    The value is sealed with the repository public key (libsodium SealedBox) before upload.
+    """
+    key_id, public_key = _get_repo_public_key(repo_name)
+    sealed = public.SealedBox(public.PublicKey(public_key)).encrypt(secret_value.encode('utf-8'))
+    payload = {
+        'encrypted_value': base64.b64encode(sealed).decode('ascii'),
+        'key_id': key_id,
+    }
+    response = _api_request('PUT', f"/repos/{repo_name}/actions/secrets/{secret_name}", json=payload)
+    response.raise_for_status()
+
+
+def set_variable(repo_name: str, var_name: str, var_value: str):
+    """
+    Sets/updates a Variable via the REST API.
+    Creates the variable first; if it already exists (HTTP 409), patches it instead.
+    """
+    response = _api_request('POST', f"/repos/{repo_name}/actions/variables",
+                            json={'name': var_name, 'value': var_value})
+    if response.status_code == 409:  # Variable already exists, update it
+        response = _api_request('PATCH', f"/repos/{repo_name}/actions/variables/{var_name}",
+                                json={'name': var_name, 'value': var_value})
+    response.raise_for_status()
+
+
+def delete_secret(repo_name: str, secret_name: str):
+    """
+    Deletes a Secret via the REST API.
+    HTTP 404 is tolerated (item already absent), matching the gh CLI path.
+    """
+    response = _api_request('DELETE', f"/repos/{repo_name}/actions/secrets/{secret_name}")
+    if response.status_code == 404:
+        add_log_entry(repo_name, f"[{repo_name}] Warning: HTTP 404 - Secret '{secret_name}' does not exist, cannot delete. Proceeding to next step.")
+        return
+    response.raise_for_status()
+
+
+def delete_variable(repo_name: str, var_name: str):
+    """
+    Deletes a Variable via the REST API.
+    HTTP 404 is tolerated (item already absent), matching the gh CLI path.
+    """
+    response = _api_request('DELETE', f"/repos/{repo_name}/actions/variables/{var_name}")
+    if response.status_code == 404:
+        add_log_entry(repo_name, f"[{repo_name}] Warning: HTTP 404 - Variable '{var_name}' does not exist, cannot delete. Proceeding to next step.")
+        return
+    response.raise_for_status()
@@ -1,8 +1,13 @@
+import json
+import random
 import subprocess
 import sys
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
 
+from core import gh_http
 from utils.utils import (
     execute_subprocess_command,
     parse_json_string,
@@ -10,12 +15,52 @@ from utils.utils import (
 
 from utils.logs import (
     add_log_entry,
+    add_log_entry_many,
 )
 
+# Upper bound on concurrent per-item gh operations within a single repository.
+_MAX_ITEM_WORKERS = 8
+
+
+class _LocalLog:
+    """
+    Per-repository log buffer. Collects messages locally and flushes them to
+    the shared collector in one locked batch, instead of acquiring the log
+    lock for every entry emitted while processing a repository.
+    """
+    __slots__ = ('group_name', 'entries')
+
+    def __init__(self, group_name: str):
+        self.group_name = group_name
+        self.entries = []
+
+    def append(self, message: str):
+        self.entries.append(message)
+
+    def flush(self):
+        add_log_entry_many(self.group_name, self.entries)
+        self.entries = []
+
+
+# Short-lived cache of existing item sets, keyed by (repo_name, item_type),
+# so concurrent workers touching the same repo share a single fetch.
+# The TTL starts at the default and is stretched by bulk_fetch_existing_items
+# to cover the whole run, so pre-fetched entries do not lapse before the
+# later repositories are picked up by a worker.
+_existing_items_cache: dict[tuple[str, str], tuple[float, set]] = {}
+_existing_items_cache_lock = threading.Lock()
+_EXISTING_ITEMS_CACHE_TTL_DEFAULT = 60  # seconds
+_existing_items_cache_ttl = _EXISTING_ITEMS_CACHE_TTL_DEFAULT
+# Rough per-repository processing budget used to size the TTL to the run.
+# Overestimating is harmless: within one run nothing else mutates the items.
+_ESTIMATED_SECONDS_PER_REPO = 5
+
 
 def _get_existing_items_from_repo(repo_name: str, item_type: str) -> set:
     """
     Retrieves a list of Secrets or Variables for a given repository via GH CLI.
+    Results are cached for a short TTL so repeated lookups for the same repo
+    do not re-fire subprocesses.
 
     Args:
         repo_name (str): The name of the repository (e.g., 'owner/repo').
@@ -24,11 +69,17 @@ def _get_existing_items_from_repo(repo_name: str, item_type: str) -> set:
     Returns:
         set: A set of item names.
     """
+    cache_key = (repo_name, item_type)
+    with _existing_items_cache_lock:
+        cached = _existing_items_cache.get(cache_key)
+        if cached and time.time() - cached[0] < _existing_items_cache_ttl:
+            return set(cached[1])
+
     if item_type == 'secret':
-        command = ['gh', 'secret', 'list', '--repo', repo_name, '--json', 'name']
+        command = ['gh', 'secret', 'list', '--repo', repo_name, '--json', 'name', '--jq', '.[].name']
         context_label = "Secret"
     elif item_type == 'variable':
-        command = ['gh', 'variable', 'list', '--repo', repo_name, '--json', 'name']
+        command = ['gh', 'variable', 'list', '--repo', repo_name, '--json', 'name', '--jq', '.[].name']
         context_label = "Variable"
     else:
         add_log_entry(repo_name, f"❌ Error: Unknown item type '{item_type}'. Must be 'secret' or 'variable'.")
@@ -36,56 +87,83 @@ def _get_existing_items_from_repo(repo_name: str, item_type: str) -> set:
 
     try:
         stdout_str = run_gh_command(command, repo_name)
-        
-        if not stdout_str: # If empty string or None
-            add_log_entry(repo_name, f"[{repo_name}] Warning: {context_label} list for repository '{repo_name}' is empty or could not be retrieved.")
-            return set()
 
-        data = parse_json_string(stdout_str, f"{context_label} list for repository '{repo_name}'")
-        
-        if data is None: # If JSON parsing failed
-            add_log_entry(repo_name, f"[{repo_name}] Warning: Failed to parse {context_label} JSON for repository '{repo_name}'.")
-            return set()
-
-        # Extract names and return as a set
-        return {item['name'] for item in data if 'name' in item} # Ensure 'name' key exists
+        # The --jq projection already reduced the output to one name per line,
+        # so no JSON parsing is needed here. run_gh_command raises on failure,
+        # so empty stdout is a legitimate zero-item listing (--jq prints
+        # nothing for []); cache it like any other result so repos without
+        # items are not re-listed on every lookup.
+        names = set(stdout_str.splitlines()) if stdout_str else set()
+        with _existing_items_cache_lock:
+            _existing_items_cache[cache_key] = (time.time(), set(names))
+        return names
     except Exception as e:
         # GH CLI might return an error if no Secrets/Variables exist, so warn and return empty set
         add_log_entry(repo_name, f"[{repo_name}] Warning: Failed to retrieve {context_label} list for repository '{repo_name}': {e}")
         return set()
 
 
+# Item sets larger than this are logged as a count instead of a sorted
+# listing, avoiding O(N log N) string work for a single log line.
+_MAX_LOGGED_ITEM_NAMES = 100
+
+
+def _summarize_item_names(names: set) -> str:
+    """Returns a sorted listing of item names, or just a count for large sets."""
+    if len(names) > _MAX_LOGGED_ITEM_NAMES:
+        return f"({len(names)} items)"
+    return ', '.join(sorted(names))
+
+
 def _log_and_fetch_existing_repo_items(repo_name: str) -> tuple[set, set]:
     """
     Fetches existing Secret and Variable lists for a repository, logs them, and returns them.
     """
     log_prefix = f"[{repo_name}]"
 
-    # Fetch and log existing Secrets
-    existing_secrets = list_repository_secrets(repo_name)
+    # Fetch both lists concurrently — they are independent gh calls.
+    # Logging happens after both resolve so the log ordering is preserved.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        secrets_future = executor.submit(list_repository_secrets, repo_name)
+        variables_future = executor.submit(list_repository_variables, repo_name)
+        existing_secrets = secrets_future.result()
+        existing_variables = variables_future.result()
+
     if existing_secrets:
-        add_log_entry(repo_name, f"{log_prefix} 🔑 Existing Secrets: {', '.join(sorted(list(existing_secrets)))}")
+        add_log_entry(repo_name, f"{log_prefix} 🔑 Existing Secrets: {_summarize_item_names(existing_secrets)}")
     else:
         add_log_entry(repo_name, f"{log_prefix} 🔑 No existing Secrets found.")
-    
-    # Fetch and log existing Variables
-    existing_variables = list_repository_variables(repo_name)
+
     if existing_variables:
-        add_log_entry(repo_name, f"{log_prefix} ⚙️ Existing Variables: {', '.join(sorted(list(existing_variables)))}")
+        add_log_entry(repo_name, f"{log_prefix} ⚙️ Existing Variables: {_summarize_item_names(existing_variables)}")
     else:
         add_log_entry(repo_name, f"{log_prefix} ⚙️ No existing Variables found.")
     
     return existing_secrets, existing_variables
 
 
-def run_gh_command(command: list, repo_name: str = None) -> str:
+def _is_rate_limit_error(error_stderr: str) -> bool:
+    """
+    Returns True if the gh stderr output indicates a (retryable) rate-limit error.
+    Only the explicit throttling signatures count: a plain HTTP 403 usually
+    means missing permissions or SAML enforcement and will not succeed on retry.
+    """
+    return "secondary rate limit" in error_stderr or \
+           "API rate limit exceeded" in error_stderr or \
+           "abuse detection" in error_stderr
+
+
+def run_gh_command(command: list, repo_name: str = None, max_retries: int = 5) -> str:
     """
     Executes a GitHub CLI command and returns its standard output.
     Handles common errors like 404 for non-existent secrets/variables during deletion.
+    Rate-limit errors (secondary rate limit, API quota, abuse detection) are
+    retried with exponential backoff instead of aborting the batch.
 
     Args:
         command (list): The command and its arguments to execute.
         repo_name (str | None): The repository name relevant to the command, for logging.
+        max_retries (int): Maximum number of retries on rate-limit errors.
 
     Returns:
         str: The decoded standard output of the command.
@@ -97,39 +175,58 @@ def run_gh_command(command: list, repo_name: str = None) -> str:
         Exception: For any other unexpected errors.
     """
     log_prefix = f"[{repo_name}] " if repo_name else ""
-    try:
-        stdout_decoded, stderr_decoded = execute_subprocess_command(command, False)
-        
-        if stderr_decoded:
-            add_log_entry(repo_name, f"{log_prefix}DEBUG: STDERR: '{stderr_decoded}'")
-
-        return stdout_decoded
-    except subprocess.CalledProcessError as e:
-        error_stderr = e.stderr.decode('utf-8', errors='replace').strip() if e.stderr else ""
-        
-        if "HTTP 404" in error_stderr and ("secret delete" in ' '.join(command) or "variable delete" in ' '.join(command)):
-            add_log_entry(repo_name, f"{log_prefix}Warning: HTTP 404 - Item does not exist, cannot delete. Proceeding to next step.")
-            return "" # Return empty string for 404 on delete, as it's not a hard error
-        if "flag needs an argument: --body" in error_stderr:
-            add_log_entry(repo_name, f"{log_prefix}❌ Error: '--body' argument missing value. Value might be empty.")
-            raise ValueError("Secret/Variable value missing error") from e
-        
-        add_log_entry(repo_name, f"{log_prefix}Fatal error occurred (GH CLI command execution): {e}. Stderr: {error_stderr}")
-        raise 
-    except FileNotFoundError:
-        add_log_entry(repo_name, f"{log_prefix}❌ GitHub CLI (gh) not found. Please ensure it is installed and in your PATH.")
-        raise FileNotFoundError("GitHub CLI (gh) not found") from None
-    except Exception as e:
-        add_log_entry(repo_name, f"{log_prefix}❌ An unexpected error occurred during gh command execution: {e}")
-        raise e
+    # Inspect the command positions directly instead of joining the whole
+    # command into a throwaway string for substring tests.
+    is_delete_command = (
+        len(command) >= 3
+        and command[1] in ('secret', 'variable')
+        and command[2] == 'delete'
+    )
+
+    for attempt in range(max_retries + 1):
+        try:
+            stdout_decoded, stderr_decoded = execute_subprocess_command(command, False)
+
+            if stderr_decoded:
+                add_log_entry(repo_name, f"{log_prefix}DEBUG: STDERR: '{stderr_decoded}'")
+
+            return stdout_decoded
+        except subprocess.CalledProcessError as e:
+            # execute_subprocess_command decodes the streams, so stderr is str
+            error_stderr = e.stderr.strip() if e.stderr else ""
+
+            if "HTTP 404" in error_stderr and is_delete_command:
+                add_log_entry(repo_name, f"{log_prefix}Warning: HTTP 404 - Item does not exist, cannot delete. Proceeding to next step.")
+                return "" # Return empty string for 404 on delete, as it's not a hard error
+            if "flag needs an argument: --body" in error_stderr:
+                add_log_entry(repo_name, f"{log_prefix}❌ Error: '--body' argument missing value. Value might be empty.")
+                raise ValueError("Secret/Variable value missing error") from e
+
+            if attempt < max_retries and _is_rate_limit_error(error_stderr):
+                delay = min(60, 2 ** attempt) + random.uniform(0, 1)
+                add_log_entry(repo_name, f"{log_prefix}⏳ Rate limit hit. Retrying in {delay:.1f}s (attempt {attempt + 1}/{max_retries})...")
+                time.sleep(delay)
+                continue
+
+            add_log_entry(repo_name, f"{log_prefix}Fatal error occurred (GH CLI command execution): {e}. Stderr: {error_stderr}")
+            raise
+        except FileNotFoundError:
+            add_log_entry(repo_name, f"{log_prefix}❌ GitHub CLI (gh) not found. Please ensure it is installed and in your PATH.")
+            raise FileNotFoundError("GitHub CLI (gh) not found") from None
+        except Exception as e:
+            add_log_entry(repo_name, f"{log_prefix}❌ An unexpected error occurred during gh command execution: {e}")
+            raise e
 
 
 def delete_github_secret(repo_name: str, secret_name: str) -> bool:
     """Deletes a Secret from the specified repository."""
-    command = ['gh', 'secret', 'delete', secret_name, '--repo', repo_name]
     try:
         add_log_entry(repo_name, f"[{repo_name}] Deleting Secret '{secret_name}'...")
-        run_gh_command(command, repo_name) 
+        if gh_http.is_available():
+            gh_http.delete_secret(repo_name, secret_name)
+        else:
+            command = ['gh', 'secret', 'delete', secret_name, '--repo', repo_name]
+            run_gh_command(command, repo_name)
         add_log_entry(repo_name, f"[{repo_name}] ✅ Successfully deleted Secret '{secret_name}'.")
         return True
     except Exception as e:
@@ -138,10 +235,13 @@ def delete_github_secret(repo_name: str, secret_name: str) -> bool:
 
 def delete_github_variable(repo_name: str, var_name: str) -> bool:
     """Deletes a Variable from the specified repository."""
-    command = ['gh', 'variable', 'delete', var_name, '--repo', repo_name]
     try:
         add_log_entry(repo_name, f"[{repo_name}] Deleting Variable '{var_name}'...")
-        run_gh_command(command, repo_name)
+        if gh_http.is_available():
+            gh_http.delete_variable(repo_name, var_name)
+        else:
+            command = ['gh', 'variable', 'delete', var_name, '--repo', repo_name]
+            run_gh_command(command, repo_name)
         add_log_entry(repo_name, f"[{repo_name}] ✅ Successfully deleted Variable '{var_name}'.")
         return True
     except Exception as e:
@@ -161,8 +261,11 @@ def set_github_secret(repo_name: str, secret_name: str, secret_value: str, force
             return True 
 
         add_log_entry(repo_name, f"[{repo_name}] Setting/updating Secret '{secret_name}'...")
-        command = ['gh', 'secret', 'set', secret_name, '--repo', repo_name, '--body', secret_value]
-        run_gh_command(command, repo_name)
+        if gh_http.is_available():
+            gh_http.set_secret(repo_name, secret_name, secret_value)
+        else:
+            command = ['gh', 'secret', 'set', secret_name, '--repo', repo_name, '--body', secret_value]
+            run_gh_command(command, repo_name)
         add_log_entry(repo_name, f"[{repo_name}] ✅ Successfully set/updated Secret '{secret_name}'.")
         return True
     except Exception as e:
@@ -182,8 +285,11 @@ def set_github_variable(repo_name: str, var_name: str, var_value: str, force: bo
             return True 
 
         add_log_entry(repo_name, f"[{repo_name}] Setting/updating Variable '{var_name}'...")
-        command = ['gh', 'variable', 'set', var_name, '--repo', repo_name, '--body', var_value]
-        run_gh_command(command, repo_name)
+        if gh_http.is_available():
+            gh_http.set_variable(repo_name, var_name, var_value)
+        else:
+            command = ['gh', 'variable', 'set', var_name, '--repo', repo_name, '--body', var_value]
+            run_gh_command(command, repo_name)
         add_log_entry(repo_name, f"[{repo_name}] ✅ Successfully set/updated Variable '{var_name}'.")
         return True
     except Exception as e:
@@ -191,42 +297,191 @@ def set_github_variable(repo_name: str, var_name: str, var_value: str, force: bo
         return False
 
 
-def get_repositories_from_github(organization_name: str) -> list[str]:
+# GraphQL query returning all repositories (public and private) for an
+# organization or user in pages of 100, regardless of visibility.
+_REPOSITORY_LIST_QUERY = (
+    "query($o:String!,$c:String){"
+    "repositoryOwner(login:$o){"
+    "repositories(first:100,after:$c){"
+    "pageInfo{hasNextPage endCursor} nodes{nameWithOwner}}}}"
+)
+
+
+def iter_repositories_from_github(organization_name: str):
+    """
+    Yields 'owner/repo' names page by page via the paginated GraphQL query,
+    without materializing the full list first. One page covers both
+    visibilities, and consumers can begin work on earlier pages while later
+    pages are still being fetched.
+
+    Raises:
+        Exception: If any GraphQL page fails to fetch or parse.
+    """
+    end_cursor = None
+    while True:
+        command = ["gh", "api", "graphql", "-f", f"query={_REPOSITORY_LIST_QUERY}", "-F", f"o={organization_name}"]
+        if end_cursor:
+            command += ["-F", f"c={end_cursor}"]
+
+        page_json_str = run_gh_command(command)
+        page_data = parse_json_string(page_json_str, "[Global] Repository GraphQL Parsing")
+        if page_data is None:
+            raise ValueError("Failed to parse repository GraphQL response.")
+
+        repositories_data = page_data["data"]["repositoryOwner"]["repositories"]
+        for repo in repositories_data["nodes"]:
+            yield repo["nameWithOwner"]
+
+        page_info = repositories_data["pageInfo"]
+        if not page_info["hasNextPage"]:
+            return
+        end_cursor = page_info["endCursor"]
+
+
+def _fetch_repositories_graphql(organization_name: str) -> set:
+    """
+    Materializes the streaming GraphQL listing into a set of 'owner/repo' names.
+
+    Raises:
+        Exception: If any GraphQL page fails to fetch or parse.
+    """
+    return set(iter_repositories_from_github(organization_name))
+
+
+# On-disk ETag cache for repository listings, keyed by organization/user.
+# A 304 response does not count against the API rate limit, so repeat runs
+# re-validate the cached list for free.
+_REPO_LIST_CACHE_FILE = Path.home() / '.cache' / 'github-config-manager' / 'repos.json'
+
+
+def _load_repo_list_cache() -> dict:
+    """Loads the persisted {org: {'etag': str, 'repositories': list}} cache, if any."""
+    try:
+        with open(_REPO_LIST_CACHE_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_repo_list_cache(cache: dict):
+    """Persists the repository-list cache, ignoring write failures."""
+    try:
+        _REPO_LIST_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(_REPO_LIST_CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+    except OSError as e:
+        add_log_entry(None, f"⚠️ Warning: Could not persist repository list cache: {e}")
+
+
+def _fetch_repositories_rest_conditional(organization_name: str) -> set:
+    """
+    Fetches the repository list over REST with a conditional request.
+
+    Uses /orgs/{org}/repos, which returns every repository the token can see
+    (public and private). /users/{name}/repos only lists public repositories,
+    so when the owner turns out to be a user (HTTP 404 on the orgs endpoint)
+    this path raises and the caller falls back to GraphQL, which covers both
+    visibilities — the cache must never hold a public-only listing.
+
+    The first page is requested with If-None-Match using the cached ETag;
+    on 304 the cached list is returned without consuming API quota. The
+    listing is sorted by 'pushed' so recent changes surface on page one and
+    invalidate the first-page ETag.
+
+    Raises:
+        Exception: If the REST path fails (callers fall back to GraphQL).
+    """
+    cache = _load_repo_list_cache()
+    cached_entry = cache.get(organization_name)
+
+    headers = {}
+    if cached_entry and cached_entry.get('etag'):
+        headers['If-None-Match'] = cached_entry['etag']
+
+    base_path = f"/orgs/{organization_name}/repos"
+    params = {'per_page': 100, 'sort': 'pushed', 'type': 'all'}
+
+    response = gh_http._api_request('GET', base_path, params={**params, 'page': 1}, headers=headers)
+    if response.status_code == 304:
+        add_log_entry(None, f"✅ Repository list for '{organization_name}' unchanged (HTTP 304). Using cached list.")
+        return set(cached_entry['repositories'])
+    if response.status_code == 404:
+        raise ValueError(
+            f"'{organization_name}' is not an organization; the user REST listing "
+            "omits private repositories, so GraphQL is used instead."
+        )
+    response.raise_for_status()
+
+    all_repositories = {repo['full_name'] for repo in response.json()}
+    etag = response.headers.get('ETag')
+    page = 2
+    while 'next' in response.links:
+        response = gh_http._api_request('GET', base_path, params={**params, 'page': page})
+        response.raise_for_status()
+        all_repositories.update(repo['full_name'] for repo in response.json())
+        page += 1
+
+    if etag:
+        cache[organization_name] = {'etag': etag, 'repositories': sorted(all_repositories)}
+        _save_repo_list_cache(cache)
+    return all_repositories
+
+
+def _fetch_repositories_by_visibility(organization_name: str, visibility: str) -> set:
+    """
+    Fallback path: fetches repositories of one visibility ('public' or 'private')
+    via 'gh repo list'. Returns a set of 'owner/repo' names.
+    """
+    repositories = set()
+    command = ["gh", "repo", "list", organization_name, "--json", "name,owner", "-L", "9999", "--visibility", visibility]
+    try:
+        repo_list_json_str = run_gh_command(command)
+        if repo_list_json_str:
+            repos_data = parse_json_string(repo_list_json_str, f"[Global] {visibility.capitalize()} Repository JSON Parsing")
+            if repos_data:
+                for repo in repos_data:
+                    repositories.add(f"{repo['owner']['login']}/{repo['name']}")
+                add_log_entry(None, f"    ✔️ Added {len(repos_data)} {visibility} repositories.")
+    except Exception as e:
+        add_log_entry(None, f"❌ Failed to fetch {visibility} repository list: {e}")
+        pass # Continue even if fetching one visibility fails
+    return repositories
+
+
+def get_repositories_from_github(organization_name: str, use_cache: bool = True) -> list[str]:
     """
     Retrieves a list of all public and private repositories for a given GitHub organization or user.
+
+    Args:
+        organization_name (str): The organization or user to list.
+        use_cache (bool): If True (and the HTTP session is available), use the
+                          on-disk ETag cache for conditional listing.
     """
     # repo_name is None for global messages
     add_log_entry(None, f"⚙️ Fetching repository list for GitHub organization/user '{organization_name}'...")
-    all_repositories = set()
 
-    # Fetch public repositories
-    public_repo_command = ["gh", "repo", "list", organization_name, "--json", "name,owner", "-L", "9999", "--visibility", "public"]
-    try:
-        public_repo_list_json_str = run_gh_command(public_repo_command)
-        if public_repo_list_json_str:
-            public_repos_data = parse_json_string(public_repo_list_json_str, "[Global] Public Repository JSON Parsing")
-            if public_repos_data:
-                for repo in public_repos_data:
-                    all_repositories.add(f"{repo['owner']['login']}/{repo['name']}")
-                add_log_entry(None, f"    ✔️ Added {len(public_repos_data)} public repositories.")
-    except Exception as e:
-        add_log_entry(None, f"❌ Failed to fetch public repository list: {e}")
-        pass # Continue even if public repo fetching fails
+    if use_cache and gh_http.is_available():
+        try:
+            all_repositories = _fetch_repositories_rest_conditional(organization_name)
+            return _finalize_repository_list(organization_name, all_repositories)
+        except Exception as e:
+            add_log_entry(None, f"⚠️ Conditional REST repository listing failed ({e}). Falling back to GraphQL.")
 
-    # Fetch private repositories
-    private_repo_command = ["gh", "repo", "list", organization_name, "--json", "name,owner", "-L", "9999", "--visibility", "private"]
     try:
-        private_repo_list_json_str = run_gh_command(private_repo_command)
-        if private_repo_list_json_str:
-            private_repos_data = parse_json_string(private_repo_list_json_str, "[Global] Private Repository JSON Parsing")
-            if private_repos_data:
-                for repo in private_repos_data:
-                    all_repositories.add(f"{repo['owner']['login']}/{repo['name']}")
-                add_log_entry(None, f"    ✔️ Added {len(private_repos_data)} private repositories.")
+        all_repositories = _fetch_repositories_graphql(organization_name)
     except Exception as e:
-        add_log_entry(None, f"❌ Failed to fetch private repository list: {e}")
-        pass # Continue even if private repo fetching fails
+        # Fall back to the two 'gh repo list' calls, fired concurrently.
+        add_log_entry(None, f"⚠️ GraphQL repository listing failed ({e}). Falling back to 'gh repo list'.")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            public_future = executor.submit(_fetch_repositories_by_visibility, organization_name, "public")
+            private_future = executor.submit(_fetch_repositories_by_visibility, organization_name, "private")
+            all_repositories = public_future.result() | private_future.result()
+
+    return _finalize_repository_list(organization_name, all_repositories)
 
+
+def _finalize_repository_list(organization_name: str, all_repositories: set) -> list[str]:
+    """Sorts the fetched repository set and logs the outcome."""
     final_repositories = sorted(list(all_repositories))
     if not final_repositories:
         add_log_entry(None, f"⚠️ Warning: No repositories found to process for organization/user '{organization_name}'.")
@@ -235,6 +490,46 @@ def get_repositories_from_github(organization_name: str) -> list[str]:
         add_log_entry(None, f"✅ Successfully fetched {len(final_repositories)} repositories from '{organization_name}'.")
         return final_repositories
         
+def bulk_fetch_existing_items(repositories: list[str], max_workers: int = 16) -> dict[str, tuple[set, set]]:
+    """
+    Warms the existing-items cache for many repositories in one concurrent sweep.
+
+    The GraphQL API does not expose Actions secrets/variables, so true
+    cross-repo batching is not possible; instead, fan the per-repo listings
+    out over a thread pool. Results land in the TTL cache consulted by
+    list_repository_secrets/list_repository_variables, so workers that
+    process these repos shortly afterwards skip their own listing calls.
+
+    Args:
+        repositories (list[str]): Full repository names ('owner/repo').
+        max_workers (int): Upper bound on concurrent listing calls.
+
+    Returns:
+        dict[str, tuple[set, set]]: Mapping of repo name to its
+        (existing secrets, existing variables) sets.
+    """
+    global _existing_items_cache_ttl
+    results: dict[str, tuple[set, set]] = {}
+    if not repositories:
+        return results
+
+    # Warmed entries must survive until the last repository is picked up by
+    # a worker, so stretch the TTL to the run instead of the 60s default.
+    _existing_items_cache_ttl = max(
+        _EXISTING_ITEMS_CACHE_TTL_DEFAULT,
+        len(repositories) * _ESTIMATED_SECONDS_PER_REPO,
+    )
+
+    add_log_entry(None, f"⚙️ Pre-fetching existing Secrets/Variables for {len(repositories)} repositories...")
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(repositories) * 2)) as executor:
+        secret_futures = {repo: executor.submit(list_repository_secrets, repo) for repo in repositories}
+        variable_futures = {repo: executor.submit(list_repository_variables, repo) for repo in repositories}
+        for repo in repositories:
+            results[repo] = (secret_futures[repo].result(), variable_futures[repo].result())
+    add_log_entry(None, f"✅ Pre-fetched existing items for {len(results)} repositories.")
+    return results
+
+
 def list_repository_secrets(repo_name: str) -> set:
     """Returns a set of Secret names for the repository."""
     return _get_existing_items_from_repo(repo_name, 'secret')
@@ -246,8 +541,8 @@ def list_repository_variables(repo_name: str) -> set:
 
 def process_single_repository(
     repo_name: str,
-    delete_secrets_list: list,
-    delete_variables_list: list,
+    delete_secrets_set: set,
+    delete_variables_set: set,
     secrets_to_set_dict: dict,
     variables_to_set_dict: dict,
     force: bool
@@ -258,8 +553,8 @@ def process_single_repository(
 
     Args:
         repo_name (str): The full name of the repository (e.g., 'owner/repo').
-        delete_secrets_list (list): List of secret names to delete.
-        delete_variables_list (list): List of variable names to delete.
+        delete_secrets_set (set): Set of secret names to delete (pre-built once per run).
+        delete_variables_set (set): Set of variable names to delete (pre-built once per run).
         secrets_to_set_dict (dict): Dictionary of secret_name: secret_value to set/update.
         variables_to_set_dict (dict): Dictionary of variable_name: variable_value to set/update.
         force (bool): If True, existing secrets/variables will be overwritten.
@@ -270,75 +565,123 @@ def process_single_repository(
     log_prefix = f"[{repo_name}]"
     overall_success = True
 
+    # Buffer this function's own log entries and flush them in one locked
+    # batch at the end, instead of taking the log lock per message.
+    local_log = _LocalLog(repo_name)
+
     try:
-        # Fetch and log existing Secret and Variable lists once
-        existing_secrets, existing_variables = _log_and_fetch_existing_repo_items(repo_name)
+        # Pre-fetching is only useful when something consults the existing
+        # sets: deletions intersect them, and non-force sets use them to skip
+        # items. With --force and nothing to delete, skip both listing calls.
+        need_existing = (
+            bool(delete_secrets_set)
+            or bool(delete_variables_set)
+            or (not force and (secrets_to_set_dict or variables_to_set_dict))
+        )
+        if need_existing:
+            # Fetch and log existing Secret and Variable lists once
+            existing_secrets, existing_variables = _log_and_fetch_existing_repo_items(repo_name)
+        else:
+            existing_secrets, existing_variables = set(), set()
 
         # Delete secrets
-        if delete_secrets_list:
-            # Only delete secrets that are in both the delete_secrets_list AND existing_secrets
-            secrets_to_actually_delete = set(delete_secrets_list).intersection(existing_secrets)
+        if delete_secrets_set:
+            # Only delete secrets that are in both the delete_secrets_set AND existing_secrets
+            secrets_to_actually_delete = delete_secrets_set & existing_secrets
             
             if secrets_to_actually_delete:
-                add_log_entry(repo_name, f"{log_prefix}    Secrets to delete (existing and requested): {list(secrets_to_actually_delete)}")
-                for secret_name in secrets_to_actually_delete:
-                    if not delete_github_secret(repo_name, secret_name):
-                        overall_success = False
+                local_log.append(f"{log_prefix}    Secrets to delete (existing and requested): {list(secrets_to_actually_delete)}")
+                # The item helpers below log straight to the group queue, so
+                # flush the buffered header first to keep it ahead of the
+                # per-item lines when the group is drained.
+                local_log.flush()
+                with ThreadPoolExecutor(max_workers=min(_MAX_ITEM_WORKERS, len(secrets_to_actually_delete))) as executor:
+                    delete_futures = {
+                        executor.submit(delete_github_secret, repo_name, secret_name): secret_name
+                        for secret_name in secrets_to_actually_delete
+                    }
+                    for future in as_completed(delete_futures):
+                        if future.result():
+                            existing_secrets.discard(delete_futures[future])
+                        else:
+                            overall_success = False
             else:
-                add_log_entry(repo_name, f"{log_prefix}    No secrets found to delete from the repository (intersection with requested list is empty).")
+                local_log.append(f"{log_prefix}    No secrets found to delete from the repository (intersection with requested list is empty).")
         # else:
         #    add_log_entry(repo_name, f"{log_prefix}    No secrets requested for deletion.")
 
         # Delete variables
-        if delete_variables_list:
-            # Only delete variables that are in both the delete_variables_list AND existing_variables
-            variables_to_actually_delete = set(delete_variables_list).intersection(existing_variables)
+        if delete_variables_set:
+            # Only delete variables that are in both the delete_variables_set AND existing_variables
+            variables_to_actually_delete = delete_variables_set & existing_variables
 
             if variables_to_actually_delete:
-                add_log_entry(repo_name, f"{log_prefix}    Variables to delete (existing and requested): {list(variables_to_actually_delete)}")
-                for var_name in variables_to_actually_delete:
-                    if not delete_github_variable(repo_name, var_name):
-                        overall_success = False
+                local_log.append(f"{log_prefix}    Variables to delete (existing and requested): {list(variables_to_actually_delete)}")
+                local_log.flush()
+                with ThreadPoolExecutor(max_workers=min(_MAX_ITEM_WORKERS, len(variables_to_actually_delete))) as executor:
+                    delete_futures = {
+                        executor.submit(delete_github_variable, repo_name, var_name): var_name
+                        for var_name in variables_to_actually_delete
+                    }
+                    for future in as_completed(delete_futures):
+                        if future.result():
+                            existing_variables.discard(delete_futures[future])
+                        else:
+                            overall_success = False
             else:
-                add_log_entry(repo_name, f"{log_prefix}    No variables found to delete from the repository (intersection with requested list is empty).")
+                local_log.append(f"{log_prefix}    No variables found to delete from the repository (intersection with requested list is empty).")
         # else:
         #    add_log_entry(repo_name, f"{log_prefix}    No variables requested for deletion.")
 
-
-        # Fetch and log existing Secret and Variable lists once
-        existing_secrets, existing_variables = _log_and_fetch_existing_repo_items(repo_name)
-
+        # The post-delete state is tracked locally above (deleted names are
+        # discarded from the initial sets), so no second fetch is needed.
 
         # Set/Update secrets
         if secrets_to_set_dict:
-            add_log_entry(repo_name, f"{log_prefix}    Secrets to set/update: {list(secrets_to_set_dict.keys())}")
-            for secret_name, secret_value in secrets_to_set_dict.items():
-                if not set_github_secret(repo_name, secret_name, secret_value, force=force, existing_secrets=existing_secrets):
-                    overall_success = False
+            local_log.append(f"{log_prefix}    Secrets to set/update: {list(secrets_to_set_dict.keys())}")
+            local_log.flush()
+            with ThreadPoolExecutor(max_workers=min(_MAX_ITEM_WORKERS, len(secrets_to_set_dict))) as executor:
+                set_futures = [
+                    executor.submit(set_github_secret, repo_name, secret_name, secret_value,
+                                    force, existing_secrets)
+                    for secret_name, secret_value in secrets_to_set_dict.items()
+                ]
+                for future in as_completed(set_futures):
+                    if not future.result():
+                        overall_success = False
         # else:
         #    add_log_entry(repo_name, f"{log_prefix}    No secrets to set.")
 
         # Set/Update variables
         if variables_to_set_dict:
-            add_log_entry(repo_name, f"{log_prefix}    Variables to set/update: {list(variables_to_set_dict.keys())}")
-            for var_name, var_value in variables_to_set_dict.items():
-                if not set_github_variable(repo_name, var_name, var_value, force=force, existing_variables=existing_variables):
-                    overall_success = False
+            local_log.append(f"{log_prefix}    Variables to set/update: {list(variables_to_set_dict.keys())}")
+            local_log.flush()
+            with ThreadPoolExecutor(max_workers=min(_MAX_ITEM_WORKERS, len(variables_to_set_dict))) as executor:
+                set_futures = [
+                    executor.submit(set_github_variable, repo_name, var_name, var_value,
+                                    force, existing_variables)
+                    for var_name, var_value in variables_to_set_dict.items()
+                ]
+                for future in as_completed(set_futures):
+                    if not future.result():
+                        overall_success = False
         # else:
         #    add_log_entry(repo_name, f"{log_prefix}    No variables to set.")
         
 
         if overall_success:
-            add_log_entry(repo_name, f"{log_prefix} ✅ Successfully processed repository '{repo_name}'.")
+            local_log.append(f"{log_prefix} ✅ Successfully processed repository '{repo_name}'.")
         else:
-            add_log_entry(repo_name, f"{log_prefix} ❌ Some operations failed for repository '{repo_name}'.")
+            local_log.append(f"{log_prefix} ❌ Some operations failed for repository '{repo_name}'.")
             
         return overall_success
 
     except Exception as e:
-        add_log_entry(repo_name, f"{log_prefix} ❌ A fatal error occurred while processing repository '{repo_name}': {e}")
-        add_log_entry(repo_name, f"{log_prefix} 💀 Repository '{repo_name}' operation failed.")
+        local_log.append(f"{log_prefix} ❌ A fatal error occurred while processing repository '{repo_name}': {e}")
+        local_log.append(f"{log_prefix} 💀 Repository '{repo_name}' operation failed.")
         return False
+    finally:
+        local_log.flush()
     
 
 
@@ -1,48 +1,51 @@
+import queue
+import selectors
 import threading
 import sys
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
 
 # Import configuration and logging modules
+from core import gh_http
 from core.configs import GitHubOperationConfig
+from utils import logs
 from utils.logs import (
     add_log_entry,
-    get_group_log_entries,
-    clear_group_log_entries,
+    add_log_entry_many,
+    add_log_group,
+    drain_group_logs,
+    flush_console_logs,
     initialize_log_collector,
 )
 
-# Global variables for repository status tracking
-_repo_statuses = {} 
-_initial_total_repos_count = 0 # Stores the total count of repositories
-_status_lock = threading.Lock() # Lock for thread-safe access to _repo_statuses and _initial_total_repos_count
+# Sentinel pushed by the repository producer to signal end of input.
+_QUEUE_END = object()
 
-class AtomicInteger:
-    """
-    A thread-safe integer counter class.
-    Prevents issues that can arise when multiple threads access and modify a value concurrently.
-    """
-    def __init__(self, value: int = 0):
-        self._value = value
-        # Use RLock to allow a thread to acquire the lock multiple times.
-        self._lock = threading.RLock()
+# Minimum seconds between progress/elapsed-time log lines in the parallel
+# completion loop, so fast-finishing repos don't flood the console.
+_PROGRESS_REPORT_INTERVAL = 1.0
 
-    def get_lock(self) -> threading.RLock:
-        """Returns the RLock object for this AtomicInteger instance."""
-        return self._lock
+def _stop_requested(config: GitHubOperationConfig) -> bool:
+    """Returns True if an abort was requested. stop_event may be None (single-worker runs)."""
+    return config.stop_event is not None and config.stop_event.is_set()
 
-    @property
-    def value(self) -> int:
-        """Returns the current value of the AtomicInteger. Protected by a lock."""
-        with self._lock:
-            return self._value
 
-    @value.setter
-    def value(self, new_value: int):
-        """Sets the value of the AtomicInteger. Protected by a lock."""
-        with self._lock:
-            self._value = new_value
+# Repository status codes. Plain ints instead of per-repo dicts: one small
+# object per repository, and transitions are a single dict-value store.
+_STATUS_PENDING = 0
+_STATUS_IN_PROGRESS = 1
+_STATUS_COMPLETED = 2
+_STATUS_FAILED = 3
 
+# Global variables for repository status tracking
+# { "repo_name": status code }
+_repo_statuses = {}
+_initial_total_repos_count = 0 # Stores the total count of repositories
+# Running counters kept in sync with _repo_statuses on every transition, so
+# progress summaries are O(1) instead of scanning all statuses per completion.
+_in_progress_count = 0
+_completed_or_failed_count = 0
+_status_lock = threading.Lock() # Lock for thread-safe access to _repo_statuses and _initial_total_repos_count
 
 def _listen_for_user_stop_input(stop_event: threading.Event):
     """
@@ -50,25 +53,52 @@ def _listen_for_user_stop_input(stop_event: threading.Event):
     If the user enters 'q', sets the stop_event to interrupt the main script's operations.
     """
     add_log_entry(None, "\nTo abort: Press 'q' and then Enter.")
-    while not stop_event.is_set():
-        if sys.stdin.isatty():  # Only receive input in a terminal environment
-            try:
-                user_input = input().strip().lower()
-                if user_input == 'q':
-                    add_log_entry(None, "Abort command detected. Current ongoing tasks will complete, but no new tasks will start.")
-                    stop_event.set()
-                    break
-            except EOFError: # If the input stream is unexpectedly closed
+
+    # Only read stdin when it is an interactive terminal. A pipe or redirect
+    # (e.g. CI) is selectable and readable-at-EOF, so the readline() below
+    # would immediately return '' and abort the whole run.
+    try:
+        interactive = sys.stdin.isatty()
+    except (AttributeError, ValueError, OSError):
+        interactive = False
+
+    if not interactive:
+        stop_event.wait()
+        add_log_entry(None, "Abort command listener thread is exiting.")
+        return
+
+    try:
+        selector = selectors.DefaultSelector()
+        selector.register(sys.stdin, selectors.EVENT_READ)
+    except (ValueError, OSError):
+        # stdin is not selectable (closed, or an unsupported platform):
+        # just block on the stop event instead of polling for input.
+        stop_event.wait()
+        add_log_entry(None, "Abort command listener thread is exiting.")
+        return
+
+    try:
+        while not stop_event.is_set():
+            # Block on stdin with a short timeout so the thread notices
+            # stop_event within 0.5s without burning CPU in a poll loop.
+            events = selector.select(timeout=0.5)
+            if not events:
+                continue
+
+            line = sys.stdin.readline()
+            if not line: # If the input stream is unexpectedly closed
                 add_log_entry(None, "Input stream closed. Abort listener exiting.")
                 stop_event.set()
                 break
-            except Exception as e: # Handle other exceptions
-                add_log_entry(None, f"An unexpected error occurred while processing input: {e}")
+            if line.strip().lower() == 'q':
+                add_log_entry(None, "Abort command detected. Current ongoing tasks will complete, but no new tasks will start.")
                 stop_event.set()
                 break
-        else:
-            # In non-terminal environments, don't wait for input, just pause briefly.
-            time.sleep(1)
+    except Exception as e: # Handle other exceptions
+        add_log_entry(None, f"An unexpected error occurred while processing input: {e}")
+        stop_event.set()
+    finally:
+        selector.close()
     add_log_entry(None, "Abort command listener thread is exiting.")
 
 
@@ -96,9 +126,8 @@ def _process_single_repository_worker(
     repo_name: str,
     config: GitHubOperationConfig,
     single_repo_processor_func,
-    completed_repos_count: AtomicInteger,
     total_repos_count: int,
-) -> bool:
+) -> tuple:
     """
     Worker function to perform Secrets and Variables operations for a single GitHub repository.
     This function checks the global stop event before starting work.
@@ -108,53 +137,99 @@ def _process_single_repository_worker(
         config (GitHubOperationConfig): Configuration object required for GitHub operations.
         single_repo_processor_func (callable): The function containing the actual repository processing logic.
                                             (e.g., process_single_repository from github_operations.py)
-        completed_repos_count (AtomicInteger): An AtomicInteger object to track the number of completed repositories.
         total_repos_count (int): The total number of repositories.
 
     Returns:
-        bool: True if repository processing was successful, False otherwise.
+        tuple: (repo_name, success) — the repository is carried in the result
+               so callers need not keep a future-to-repo mapping.
     """
     success = False  # Set default to False
     try:
-        if config.stop_event.is_set():
+        if _stop_requested(config):
             # add_log_message(repo_name, "⚠️ Abort command detected. Skipping this repository.")
-            return False  # Return False as processing was skipped
+            return repo_name, False  # Return False as processing was skipped
 
         set_repository_in_progress(repo_name) # 리포지토리 처리 시작 전에 'in_progress'로 설정
         # add_log_entry(repo_name, f"[{repo_name}] Starting processing...")
 
         # Call the function containing the actual repository processing logic
         # This will be process_single_repository defined in github_operations.py
-        success = single_repo_processor_func(  # Receive the return value here
-            repo_name,
-            config.delete_secrets,
-            config.delete_variables,
+        # Destructure the config once so the call below doesn't repeat the
+        # attribute lookups.
+        ds, dv, ss, vs, force = (
+            config.delete_secrets_set,
+            config.delete_variables_set,
             config.secrets_to_set,
             config.variables_to_set,
-            config.force
+            config.force,
         )
+        success = single_repo_processor_func(repo_name, ds, dv, ss, vs, force)  # Receive the return value here
 
         # Assuming single_repo_processor_func returns True/False
         add_log_entry(repo_name, f"✅ Repository processing {'completed' if success else 'failed'} (Success: {success}).")
 
-        # Update the count of completed repositories (thread-safe)
-        with completed_repos_count.get_lock():
-            completed_repos_count.value += 1
-
-        return success  # Return whether the operation was successful
+        return repo_name, success  # Return whether the operation was successful
 
     except Exception as exc:
         add_log_entry(repo_name, f"❌ Error processing repository '{repo_name}': {exc}")
-        return False  # Consider it a failure if an error occurs
+        return repo_name, False  # Consider it a failure if an error occurs
     finally:
         # Log final status and progress of the worker thread
-        if not config.stop_event.is_set():
+        if not _stop_requested(config):
             add_log_entry(
                 None,
                 f"Completed Repo: {repo_name}"
             )
 
 
+def _process_pool_worker_init():
+    """
+    Runs once in each child process of the process pool. Fork-started
+    children inherit module state that must not be reused: the console
+    drainer flag without its thread (global log lines would queue forever
+    unseen) and the parent's pooled HTTP sockets. Reset both so each child
+    starts clean.
+    """
+    logs.reset_after_fork()
+    gh_http.reset_after_fork()
+
+
+def _process_pool_repo_worker(
+    repo_name: str,
+    single_repo_processor_func,
+    delete_secrets_set: set,
+    delete_variables_set: set,
+    secrets_to_set: dict,
+    variables_to_set: dict,
+    force: bool,
+) -> tuple:
+    """
+    Worker for executor_kind="process": runs in a child process, where the
+    parent's stop_event, status tracker and log queues do not exist. Takes
+    only picklable arguments, collects the repository's logs locally, and
+    ships them back so the parent can print them in order.
+
+    Returns:
+        tuple: (repo_name, success, list of log messages produced in the child).
+    """
+    add_log_group(repo_name)
+    success = False
+    try:
+        success = single_repo_processor_func(
+            repo_name,
+            delete_secrets_set,
+            delete_variables_set,
+            secrets_to_set,
+            variables_to_set,
+            force
+        )
+        add_log_entry(repo_name, f"✅ Repository processing {'completed' if success else 'failed'} (Success: {success}).")
+    except Exception as exc:
+        add_log_entry(repo_name, f"❌ Error processing repository '{repo_name}': {exc}")
+        success = False
+    return repo_name, success, drain_group_logs(repo_name)
+
+
 #---
 ## Parallel Repository Processing Function
 #---
@@ -162,6 +237,7 @@ def _process_single_repository_worker(
 def process_repositories(
     config: GitHubOperationConfig,
     single_repo_processor_func,
+    prefetch_func=None,
 ):
     """
     Performs Secrets and Variables operations on the given list of repositories, either in parallel or sequentially.
@@ -169,12 +245,26 @@ def process_repositories(
     Args:
         config (GitHubOperationConfig): Configuration object required for GitHub operations.
         single_repo_processor_func (callable): Function to process a single repository (e.g., process_single_repository).
+        prefetch_func (callable | None): Optional function taking the repository list,
+                                         used to warm caches before parallel processing
+                                         (e.g., bulk_fetch_existing_items).
     """
 
     start_time = time.time()  # Start time measurement
 
-    initialize_repository_statuses(config.repositories)  # Initialize repository results in the log module
-    initialize_log_collector(config.repositories)
+    # config.repositories may be a plain list or a streaming iterable; when
+    # streaming, repositories are registered incrementally by the producer.
+    known_repositories = config.repositories if hasattr(config.repositories, '__len__') else []
+
+    initialize_repository_statuses(known_repositories)  # Initialize repository results in the log module
+    initialize_log_collector(known_repositories)
+
+    # Warm per-repo caches in one concurrent sweep before workers start.
+    if prefetch_func is not None and config.max_workers > 1 and known_repositories:
+        try:
+            prefetch_func(known_repositories)
+        except Exception as exc:
+            add_log_entry(None, f"⚠️ Pre-fetching existing items failed (continuing without warm cache): {exc}")
 
     add_log_entry(None, "\n[INFO] You can abort the operation at any time by typing 'q' and pressing Enter.")
 
@@ -183,86 +273,165 @@ def process_repositories(
 
     if config.max_workers == 1:  # Sequential processing
         add_log_entry(None, "\n--- Starting GitHub Repository Variable/Secret Automation (Sequential Processing) ---")
+        last_index = len(config.repositories) - 1
         for i, repo in enumerate(config.repositories):
-            if config.stop_event.is_set():
+            if _stop_requested(config):
                 add_log_entry(None, "\n⚠️ Abort command detected. Stopping sequential processing.")
                 break
 
             add_log_entry(repo, f"\n[INFO] To abort, type 'q' and press Enter: Currently processing {repo}...")
 
+            success = False  # Set default to False
             try:
                 success = single_repo_processor_func(
                     repo,
-                    config.delete_secrets,
-                    config.delete_variables,
+                    config.delete_secrets_set,
+                    config.delete_variables_set,
                     config.secrets_to_set,
                     config.variables_to_set,
                     config.force
                 )
-                set_repository_status(repo, success)
             except Exception as exc:
                 add_log_entry(repo, f"❌ Error processing repository '{repo}': {exc}")
-                set_repository_status(repo, False)
+                success = False
             finally:
-                repo_status_text = 'Success' if get_repository_overall_status(repo) else 'Failure'
-                for msg in get_group_log_entries(repo):
-                    add_log_entry(None, msg)
-                clear_group_log_entries(repo)  # Clear log buffer
+                finalize_repo(repo, success)
+                add_log_entry_many(None, drain_group_logs(repo))  # Flush the repo's log buffer
 
-            if i < len(config.repositories) - 1 and not config.stop_event.is_set():
+            if i < last_index and not _stop_requested(config):
                 add_log_entry(None, "[INFO] To abort, type 'q' and press Enter.")
-                time.sleep(config.sleep_after_repo)
+                if config.stop_event is not None:
+                    # Interruptible sleep: returns as soon as the user aborts
+                    # instead of finishing the full pause; the loop's top
+                    # check then logs the abort and stops.
+                    config.stop_event.wait(timeout=config.sleep_after_repo)
+                else:
+                    time.sleep(config.sleep_after_repo)
 
     else:  # Parallel processing
         add_log_entry(None, f"\n--- Starting GitHub Repository Variable/Secret Automation (Parallel Processing, {config.max_workers} concurrent) ---")
         add_log_entry(None, "[INFO] To abort, type 'q' and press Enter.")
 
-        completed_repos_count = AtomicInteger(0)  # Counter for completed repos in parallel processing
+        total_repos_count = len(known_repositories)
 
-        with ThreadPoolExecutor(max_workers=config.max_workers) as executor:
-            futures = {}
-            for repo in config.repositories:
-                if config.stop_event.is_set():
+        # Hoisted stop probe: one bound-method call per check instead of
+        # re-resolving config.stop_event each time through the hot loops.
+        stop_event = config.stop_event
+        stopped = stop_event.is_set if stop_event is not None else (lambda: False)
+
+        # Producer thread: feeds repository names into a bounded queue so
+        # workers can start on earlier pages while later pages (for streaming
+        # sources) are still being fetched.
+        repo_queue = queue.Queue(maxsize=config.max_workers * 4)
+
+        def _produce_repositories():
+            try:
+                for repo in config.repositories:
+                    if stopped():
+                        break
+                    add_repository_status(repo)  # No-op for pre-registered repos
+                    add_log_group(repo)
+                    repo_queue.put(repo)
+            finally:
+                repo_queue.put(_QUEUE_END)
+
+        producer_thread = threading.Thread(target=_produce_repositories, daemon=True)
+        producer_thread.start()
+
+        # "process" sidesteps the GIL for CPU-heavy runs (secret sealing, JSON
+        # parsing); children cannot see stop_event, so aborts only stop the
+        # submission of new tasks in that mode. The initializer resets
+        # fork-inherited module state (console drainer flag, HTTP session)
+        # in each child.
+        use_processes = config.executor_kind == "process"
+        if use_processes:
+            executor = ProcessPoolExecutor(
+                max_workers=config.max_workers,
+                initializer=_process_pool_worker_init,
+            )
+        else:
+            executor = ThreadPoolExecutor(max_workers=config.max_workers)
+
+        # Monotonic timestamp of the last progress report; throttles the
+        # per-completion log lines to one per _PROGRESS_REPORT_INTERVAL.
+        last_report = 0.0
+
+        def _consume_completed(future):
+            """Unpacks one finished future, finalizes its repo and reports progress."""
+            nonlocal last_report
+            try:
+                if use_processes:
+                    repo, success, child_logs = future.result()
+                    add_log_entry_many(repo, child_logs)
+                else:
+                    repo, success = future.result()
+            except Exception as exc:
+                # Workers catch their own errors; reaching here means the
+                # future itself failed (e.g. unpicklable result), so the
+                # repo name is unknown.
+                add_log_entry(None, f"❌ A repository task failed during execution: {exc}")
+                return
+
+            # One locked status update + summary, one locked log drain.
+            total, completed, in_progress = finalize_repo(repo, success)
+            add_log_entry_many(None, drain_group_logs(repo))
+
+            if not stopped():
+                now = time.monotonic()
+                if now - last_report >= _PROGRESS_REPORT_INTERVAL:
+                    last_report = now
+                    add_log_entry(None, f"[Progress] Total Repos: {total}, Completed: {completed}, In Progress: {in_progress}")
+
+                    elapsed_time = time.time() - start_time
+                    add_log_entry(None, f"✨ Elapsed time so far: {elapsed_time:.2f} seconds ✨")
+
+                    add_log_entry(None, "[INFO] To abort, type 'q' and press Enter.")
+
+        # Keep at most 2x max_workers futures in flight: results are consumed
+        # while later repositories are still being submitted (or fetched by
+        # the producer), so memory stays bounded for large organizations.
+        max_pending = config.max_workers * 2
+
+        with executor:
+            pending = set()
+            while True:
+                repo = repo_queue.get()
+                if repo is _QUEUE_END:
+                    break
+                if stopped():
                     add_log_entry(None, "⚠️ Abort command detected. Stopping submission of new repository tasks.")
                     break
 
-                future = executor.submit(
-                    _process_single_repository_worker,
-                    repo,
-                    config,
-                    single_repo_processor_func,
-                    completed_repos_count,
-                    len(config.repositories)
-                )
-                futures[future] = repo
-
-            # Process completed tasks via as_completed
-            for future in as_completed(futures):
-                repo = futures[future]
-
-                try:
-                    success = future.result()
-                    set_repository_status(repo, success)  # Set status based on success returned by worker function
-                except Exception as exc:
-                    add_log_entry(repo, f"❌ Error processing repository '{repo}' during thread execution: {exc}")
-                    set_repository_status(repo, False)
-                finally:
-                    # Output logs for repositories processed in parallel
-                    repo_status_text = 'Success' if get_repository_overall_status(repo) else 'Failure'
-                    for msg in get_group_log_entries(repo):
-                        add_log_entry(None, msg)
-                    clear_group_log_entries(repo)  # Clear log buffer
-
-                    total, completed, in_progress = get_current_progress_summary()
-                    if not config.stop_event.is_set():
-                        add_log_entry(None, f"[Progress] Total Repos: {total}, Completed: {completed}, In Progress: {in_progress}")
-
-                        cur_time = time.time()
-                        elapsed_time = cur_time - start_time
-                        add_log_entry(None, f"✨ Elapsed time so far: {elapsed_time:.2f} seconds ✨")
-
-                if not config.stop_event.is_set():
-                    add_log_entry(None, "[INFO] To abort, type 'q' and press Enter.")
+                if len(pending) >= max_pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for finished in done:
+                        _consume_completed(finished)
+
+                if use_processes:
+                    set_repository_in_progress(repo)
+                    future = executor.submit(
+                        _process_pool_repo_worker,
+                        repo,
+                        single_repo_processor_func,
+                        config.delete_secrets_set,
+                        config.delete_variables_set,
+                        config.secrets_to_set,
+                        config.variables_to_set,
+                        config.force
+                    )
+                else:
+                    future = executor.submit(
+                        _process_single_repository_worker,
+                        repo,
+                        config,
+                        single_repo_processor_func,
+                        total_repos_count
+                    )
+                pending.add(future)
+
+            # Drain whatever is still in flight.
+            for future in as_completed(pending):
+                _consume_completed(future)
 
     add_log_entry(None, "\n--- All repository processing completed ---")
 
@@ -270,42 +439,83 @@ def process_repositories(
     elapsed_time = end_time - start_time
     add_log_entry(None, f"\n✨ Overall operation completed! Total time taken: {elapsed_time:.2f} seconds ✨")
 
+    # Console output is batched by a daemon thread; make sure everything is
+    # on screen before returning (and before the process can exit).
+    flush_console_logs()
+
 
 def initialize_repository_statuses(repositories: list):
     """
     Initializes the _repo_statuses dictionary and stores the total number of repositories.
     """
-    global _repo_statuses, _initial_total_repos_count
+    global _repo_statuses, _initial_total_repos_count, _in_progress_count, _completed_or_failed_count
     with _status_lock:
-        _repo_statuses = {
-            repo: {"success": False, "status": "pending"}
-            for repo in repositories
-        }
+        _repo_statuses = dict.fromkeys(repositories, _STATUS_PENDING)
         _initial_total_repos_count = len(repositories)
+        _in_progress_count = 0
+        _completed_or_failed_count = 0
+
+def add_repository_status(repo_name: str):
+    """
+    Registers a repository in the status tracker as 'pending' if not already
+    present. Used for repositories discovered after initialization.
+    """
+    global _initial_total_repos_count
+    with _status_lock:
+        if repo_name not in _repo_statuses:
+            _repo_statuses[repo_name] = _STATUS_PENDING
+            _initial_total_repos_count += 1
+
+def _record_final_status(repo_name: str, success: bool):
+    """
+    Applies a terminal status transition and updates the running counters.
+    Must be called with _status_lock held.
+    """
+    global _in_progress_count, _completed_or_failed_count
+    previous_status = _repo_statuses.get(repo_name)
+    if previous_status is None:
+        sys.stdout.write(f"[WARN: Status Update] Repo '{repo_name}' not found in status tracker.\n")
+        sys.stdout.flush()
+        return
+    _repo_statuses[repo_name] = _STATUS_COMPLETED if success else _STATUS_FAILED
+    if previous_status == _STATUS_IN_PROGRESS:
+        _in_progress_count -= 1
+    if previous_status < _STATUS_COMPLETED:
+        _completed_or_failed_count += 1
 
 def set_repository_status(repo_name: str, success: bool):
     """
     Sets the success/failure status and progress status for a specific repository.
     """
     with _status_lock:
-        if repo_name in _repo_statuses:
-            _repo_statuses[repo_name]["success"] = success
-            if success:
-                _repo_statuses[repo_name]["status"] = "completed"
-            else:
-                _repo_statuses[repo_name]["status"] = "failed"
-        else:
-            sys.stdout.write(f"[WARN: Status Update] Repo '{repo_name}' not found in status tracker.\n")
-            sys.stdout.flush()
+        _record_final_status(repo_name, success)
 
 def set_repository_in_progress(repo_name: str):
     """
     Sets the status of a specific repository to 'in_progress'.
+
+    Invariant: callers invoke this exactly once per repository, before its
+    final status is recorded. Transitions are monotonic, so the old pending
+    guard is unnecessary and the locked section is one store + one increment.
+    """
+    global _in_progress_count
+    with _status_lock:
+        _repo_statuses[repo_name] = _STATUS_IN_PROGRESS
+        _in_progress_count += 1
+
+
+def finalize_repo(repo_name: str, success: bool) -> tuple:
+    """
+    Records the final status of a repository and returns the progress summary
+    under a single _status_lock acquisition, instead of separate
+    set_repository_status + get_current_progress_summary calls per completion.
+
+    Returns:
+        tuple: (total repositories, completed or failed, in progress).
     """
     with _status_lock:
-        if repo_name in _repo_statuses and _repo_statuses[repo_name]["status"] == "pending":
-            _repo_statuses[repo_name]["status"] = "in_progress"
-        # If already in_progress or completed/failed, do not change
+        _record_final_status(repo_name, success)
+        return _initial_total_repos_count, _completed_or_failed_count, _in_progress_count
 
 
 def get_repository_overall_status(repo_name: str) -> bool:
@@ -313,7 +523,7 @@ def get_repository_overall_status(repo_name: str) -> bool:
     Retrieves the final success/failure status for a specific repository.
     """
     with _status_lock:
-        return _repo_statuses.get(repo_name, {}).get("success", False)
+        return _repo_statuses.get(repo_name) == _STATUS_COMPLETED
 
 def get_current_progress_summary() -> tuple:
     """
@@ -321,14 +531,4 @@ def get_current_progress_summary() -> tuple:
     (Total repositories, number of completed or failed repositories, number of repositories currently in progress)
     """
     with _status_lock:
-        total_repos = _initial_total_repos_count
-        completed_or_failed_repos = 0
-        in_progress_repos = 0
-
-        for status_data in _repo_statuses.values():
-            if status_data["status"] in ["completed", "failed"]:
-                completed_or_failed_repos += 1
-            elif status_data["status"] == "in_progress":
-                in_progress_repos += 1
-
-        return total_repos, completed_or_failed_repos, in_progress_repos
\ No newline at end of file
+        return _initial_total_repos_count, _completed_or_failed_count, _in_progress_count
\ No newline at end of file
@@ -1,3 +1,4 @@
+import os
 import sys
 
 from core.cli_parser import parse_arguments
@@ -5,29 +6,43 @@ from core.github_operations import (
     get_repositories_from_github,
     display_and_confirm_actions,
     process_single_repository,
+    bulk_fetch_existing_items,
 )
 from utils.utils import read_key_value_pairs, read_list_from_file, validate_file_path
 from core.main_processor import start_abort_listener_thread, process_repositories # Renamed from 'threads' to 'main_processor'
 from utils.logs import add_log_entry
 from core.configs import GitHubOperationConfig
+from core import gh_http
 
 def main():
     """
     Main function to parse arguments, configure GitHub operations,
     and initiate the processing of repositories.
     """
-    args = parse_arguments() 
-    
+    args = parse_arguments()
+
+    # When --workers is omitted, auto-size the pool: GitHub API calls are
+    # network-latency-bound, so a 5x CPU multiplier (capped at 32) keeps the
+    # pipeline full without an excessive thread count.
+    workers = args.workers
+    if workers is None:
+        workers = min(32, (os.cpu_count() or 1) * 5)
+
     # Create GitHubOperationConfig object and assign arguments
     config = GitHubOperationConfig(
         organization=args.organization,
-        max_workers=args.workers,
+        max_workers=workers,
         sleep_after_repo=args.sleep,
-        force=args.force
+        force=args.force,
+        executor_kind=args.executor
     )
 
     add_log_entry(None, f"Configured GitHub Organization/User: {config.organization}")
 
+    # Size the shared HTTP connection pool from the worker count (no-op when
+    # the optional HTTP dependencies are missing and the gh CLI path is used).
+    gh_http.configure_pool_size(config.max_workers)
+
     # Read secrets to set from file
     if args.secrets_file:
         secrets_file_path = validate_file_path(args.secrets_file, "secret configuration file")
@@ -52,25 +67,33 @@ def main():
         if dv_file: # Ensure file path is valid before reading
             config.delete_variables = read_list_from_file(dv_file, "variable deletion list")
 
+    # Rebuild the set views now that the deletion lists are loaded
+    config.rebuild_delete_sets()
+
     # Determine target repositories
     if args.tr:
         try:
-            with open(args.tr.resolve(), 'r', encoding='utf-8') as f:
-                target_repo_names = [line.strip() for line in f if line.strip() and not line.startswith('#')]
-                # Prepend organization if not already 'owner/repo' format
-                config.repositories = [f"{config.organization}/{r}" if '/' not in r else r for r in target_repo_names]
+            lines = args.tr.read_text(encoding='utf-8').splitlines()
+            target_repo_names = [stripped for line in lines if (stripped := line.strip()) and not line.startswith('#')]
+            # Prepend organization if not already 'owner/repo' format
+            org_prefix = config.organization + '/'
+            config.repositories = [org_prefix + r if '/' not in r else r for r in target_repo_names]
             add_log_entry(None, f"📌 '--tr' option used: {len(config.repositories)} specific repositories designated.")
         except Exception as e:
             add_log_entry(None, f"❌ Error processing '--tr' file: {e}")
             sys.exit(1)
     else:
-        config.repositories = get_repositories_from_github(config.organization)
+        config.repositories = get_repositories_from_github(config.organization, use_cache=not args.no_cache)
     
     # Exit if no repositories to process
     if not config.repositories:
         add_log_entry(None, "No repositories to process. Exiting script.")
         sys.exit(0)
 
+    # Don't spin up more workers than there are repositories.
+    if config.max_workers > len(config.repositories):
+        config.max_workers = max(1, len(config.repositories))
+
     # Display and confirm actions
     display_and_confirm_actions(
         config.delete_secrets,
@@ -86,10 +109,22 @@ def main():
     # Start the abort listener thread and assign the stop event to config
     config.stop_event, _ = start_abort_listener_thread() 
 
+    # Pre-fetching existing items only pays off when something consults
+    # them: deletions intersect the existing sets, and non-force sets use
+    # them to skip items (same condition process_single_repository applies
+    # before its own listing calls). With --force and nothing to delete,
+    # the prefetch would be 2 wasted API calls per repository.
+    need_existing = (
+        bool(config.delete_secrets_set)
+        or bool(config.delete_variables_set)
+        or (not config.force and (config.secrets_to_set or config.variables_to_set))
+    )
+
     # Process repositories using the main processor function
     process_repositories(
         config,
-        process_single_repository
+        process_single_repository,
+        prefetch_func=bulk_fetch_existing_items if need_existing else None
     )
         
 if __name__ == "__main__":
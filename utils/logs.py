@@ -1,16 +1,30 @@
+import queue
 import sys
 import threading
+from contextlib import contextmanager
 
 # Manages detailed logs for all groups.
-# { "group_name": {"logs": list} }
-_all_group_logs = {}  # Stores detailed logs per group
-_log_lock = threading.Lock()  # Lock for thread-safe access to _all_group_logs and console output
+# { "group_name": SimpleQueue }
+# SimpleQueue.put/get are atomic at the C level, so worker threads append
+# without contending on a global lock; _log_lock only guards registration.
+_all_group_logs = {}  # Stores a log queue per group
+_log_lock = threading.Lock()  # Lock for group registration in _all_group_logs
+_console_lock = threading.Lock()  # Keeps interleaved console writes atomic
+
+# Console output is funneled through a drainer thread once the collector is
+# initialized, so each log line is a lock-free queue put instead of a
+# write()+flush() syscall pair. Before initialization (and for prompts),
+# writes stay synchronous.
+_console_q = queue.SimpleQueue()
+_console_drainer_started = False
+_CONSOLE_BATCH_MAX = 64  # Max messages coalesced into one write+flush
+_CONSOLE_IDLE_TIMEOUT = 0.05  # Seconds to wait for more messages before flushing
 
 
 def initialize_log_collector(group_names: list):
     """
     Initializes the _all_group_logs dictionary.
-    Each group will simply contain a list of logs.
+    Each group holds a SimpleQueue of log messages.
 
     Args:
         group_names (list): A list of group names (e.g., repository names) to initialize.
@@ -18,15 +32,138 @@ def initialize_log_collector(group_names: list):
     global _all_group_logs
     with _log_lock:
         _all_group_logs = {
-            name: {"logs": []}
+            name: queue.SimpleQueue()
             for name in group_names
         }
+    _ensure_console_drainer()
+
+
+def add_log_group(group_name: str):
+    """
+    Registers a single log group if it is not already present.
+    Used for repositories discovered after the collector was initialized
+    (e.g., streamed in page by page).
+
+    Args:
+        group_name (str): The name of the group to register.
+    """
+    with _log_lock:
+        _all_group_logs.setdefault(group_name, queue.SimpleQueue())
+
+
+def reset_after_fork():
+    """
+    Reinitializes module state inside a forked worker process. A fork-started
+    child inherits _console_drainer_started = True but not the drainer thread
+    itself, so without this reset its global messages would sit on _console_q
+    forever unseen. Group queues are also dropped: the child registers its
+    own groups and ships their contents back to the parent explicitly.
+    The locks are replaced rather than acquired — an inherited lock may have
+    been held by a parent thread at fork time and would never be released.
+    """
+    global _all_group_logs, _log_lock, _console_lock, _console_q, _console_drainer_started
+    _log_lock = threading.Lock()
+    _console_lock = threading.Lock()
+    _all_group_logs = {}
+    _console_q = queue.SimpleQueue()
+    _console_drainer_started = False
+
+
+def _write_console(text: str):
+    """Writes pre-formatted text to the console under the console lock."""
+    with _console_lock:
+        sys.stdout.write(text)
+        sys.stdout.flush()
+
+
+def _write_console_bytes(text: str):
+    """
+    Writes a batch through sys.stdout.buffer, encoding once and skipping the
+    TextIOWrapper encode/newline path per write. Falls back to the text
+    writer when stdout has no binary buffer (e.g. replaced by a capturing
+    stream in tests).
+    """
+    buffer = getattr(sys.stdout, 'buffer', None)
+    if buffer is None:
+        _write_console(text)
+        return
+    data = text.encode('utf-8')
+    with _console_lock:
+        try:
+            buffer.write(data)
+            buffer.flush()
+        except (AttributeError, ValueError):
+            # Buffer detached mid-write; retry through the text interface.
+            sys.stdout.write(text)
+            sys.stdout.flush()
+
+
+def _emit_console(text: str):
+    """
+    Hands pre-formatted text to the console drainer thread, or writes it
+    synchronously when the drainer has not been started yet.
+    """
+    if _console_drainer_started:
+        _console_q.put(text)
+    else:
+        _write_console(text)
+
+
+def _ensure_console_drainer():
+    """Starts the console drainer thread once (idempotent)."""
+    global _console_drainer_started
+    if _console_drainer_started:
+        return
+    with _log_lock:
+        if _console_drainer_started:
+            return
+        threading.Thread(target=_drain_console, daemon=True).start()
+        _console_drainer_started = True
+
+
+def _drain_console():
+    """
+    Daemon loop: coalesces queued console messages into a single write()
+    followed by one flush() per batch (up to _CONSOLE_BATCH_MAX messages or
+    until the queue stays empty for _CONSOLE_IDLE_TIMEOUT seconds).
+    threading.Event items are flush markers set once prior text is written.
+    """
+    while True:
+        batch = [_console_q.get()]
+        while len(batch) < _CONSOLE_BATCH_MAX:
+            try:
+                batch.append(_console_q.get(timeout=_CONSOLE_IDLE_TIMEOUT))
+            except queue.Empty:
+                break
+        text = ''.join(item for item in batch if isinstance(item, str))
+        if text:
+            _write_console_bytes(text)
+        for item in batch:
+            if isinstance(item, threading.Event):
+                item.set()
+
+
+def flush_console_logs(timeout: float = 2.0):
+    """
+    Blocks until console messages enqueued so far have been written, or the
+    timeout elapses. Call before prompting for input or exiting so buffered
+    output is not lost or reordered.
+
+    Args:
+        timeout (float): Maximum seconds to wait for the drainer.
+    """
+    if not _console_drainer_started:
+        return
+    flushed = threading.Event()
+    _console_q.put(flushed)
+    flushed.wait(timeout)
 
 
 def add_log_entry(group_name: str | None, message: str, store: bool = True, is_prompt: bool = False):
     """
-    Adds a message to a specific group's log collector and prints it to the console.
-    This function is designed to be thread-safe.
+    Adds a message to a specific group's log collector or prints it to the console.
+    This function is designed to be thread-safe; stored messages go through a
+    lock-free SimpleQueue put.
 
     Args:
         group_name (str | None): The name of the group to add the message to (e.g., repository name).
@@ -38,49 +175,82 @@ def add_log_entry(group_name: str | None, message: str, store: bool = True, is_p
                           If it's a prompt, no newline character is added after the message.
                           Defaults to False.
     """
-    with _log_lock:
-        # Console output is always performed.
+    if store and group_name is not None:
+        group_queue = _all_group_logs.get(group_name)
+        if group_queue is None:
+            # Warn on console if the group is missing, but don't store the message
+            _emit_console(f"[WARN: Missing Log Group - '{group_name}'] Message not stored: {message}\n")
+        else:
+            group_queue.put(message)
+    elif is_prompt:
+        # Prompts stay synchronous (and drain buffered output first) so the
+        # user always sees them immediately and in order.
+        flush_console_logs()
+        _write_console(message)
+    else:
+        _emit_console(f"{message}\n")
 
 
-        # Log storage logic
-        if store and group_name is not None:
-            if group_name not in _all_group_logs:
-                # Log a warning to console if group is missing, but don't store the message
-                sys.stdout.write(f"[WARN: Missing Log Group - '{group_name}'] Message not stored: {message}\n")
-                sys.stdout.flush()
-            else:
-                _all_group_logs[group_name]["logs"].append(message)
+def add_log_entry_many(group_name: str | None, messages: list):
+    """
+    Adds multiple messages in one batch.
+    Group messages are stored exactly like repeated add_log_entry calls;
+    global messages (group_name is None) are written to the console as one write.
+
+    Args:
+        group_name (str | None): The name of the group to add the messages to.
+        messages (list): The messages to log, in order.
+    """
+    if not messages:
+        return
+    if group_name is not None:
+        group_queue = _all_group_logs.get(group_name)
+        if group_queue is None:
+            _emit_console(f"[WARN: Missing Log Group - '{group_name}'] {len(messages)} messages not stored.\n")
         else:
-            if is_prompt:
-                sys.stdout.write(message)
-            else:
-                sys.stdout.write(f"{message}\n")
-            sys.stdout.flush()
+            for message in messages:
+                group_queue.put(message)
+    else:
+        _emit_console(''.join(f"{message}\n" for message in messages))
+
 
-def get_group_log_entries(group_name: str) -> list:
+@contextmanager
+def batched_logs(group_name: str | None):
     """
-    Retrieves the log entries for a specific group.
+    Context manager for hot loops that emit many log lines: yields a
+    log(message) callable that appends to a plain local list, and flushes
+    the whole batch through add_log_entry_many on exit — one queue/console
+    interaction per batch instead of per message. Flushes even when the
+    body raises, so diagnostics emitted before the failure are kept.
 
     Args:
-        group_name (str): The name of the group whose logs are to be retrieved.
-
-    Returns:
-        list: A list of log messages for the specified group. Returns an empty list if the group does not exist.
+        group_name (str | None): The group the batched messages belong to
+                                 (None for global/console messages).
     """
-    with _log_lock:
-        return _all_group_logs.get(group_name, {}).get("logs", [])
+    entries = []
+    try:
+        yield entries.append
+    finally:
+        add_log_entry_many(group_name, entries)
 
 
-def clear_group_log_entries(group_name: str):
+def drain_group_logs(group_name: str) -> list:
     """
-    Deletes (clears) the log entries for a specific group from memory.
+    Pops all pending log entries for a group, leaving its queue empty.
 
     Args:
-        group_name (str): The name of the group whose logs are to be cleared.
+        group_name (str): The name of the group whose logs are to be drained.
+
+    Returns:
+        list: The drained log messages (empty if the group does not exist).
     """
-    with _log_lock:
-        if group_name in _all_group_logs:
-            _all_group_logs[group_name]["logs"] = []
-        else:
-            sys.stdout.write(f"[WARN: Clear Logs] Group '{group_name}' not found in collector.\n")
-            sys.stdout.flush()
\ No newline at end of file
+    group_queue = _all_group_logs.get(group_name)
+    if group_queue is None:
+        return []
+    messages = []
+    while True:
+        try:
+            messages.append(group_queue.get_nowait())
+        except queue.Empty:
+            break
+    return messages
@@ -1,10 +1,117 @@
-import sys
+import asyncio
+import os
+import stat
 import json
+import mmap
+import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 
-# Import function for logging messages
-from utils.logs import add_log_entry
+# Import functions for logging messages
+from utils.logs import add_log_entry, batched_logs
+
+# orjson parses typical GitHub API payloads (repo/secret listings) a few
+# times faster than the stdlib and accepts bytes directly; fall back to
+# json.loads when it is not installed. orjson.JSONDecodeError subclasses
+# json.JSONDecodeError, so one except clause covers both parsers.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# os.readv fills a caller-owned buffer directly; absent (e.g. Windows),
+# read_text_file_content falls back to os.read with one copy per chunk.
+_HAS_READV = hasattr(os, 'readv')
+
+
+class CommandNotFoundError(FileNotFoundError):
+    """
+    Raised when a command's executable cannot be found on PATH.
+    A typed exception (instead of exiting the process) lets batch runners
+    skip the one affected command and keep the rest of the batch going.
+    """
+
+
+def _useful(raw: bytes) -> bytes | None:
+    """
+    Shared line predicate for the byte-mode parsers: strips a raw line and
+    returns it, or None for blanks and '#' comments, before any decoding.
+    Column-0 comments and whitespace-only lines are rejected without even
+    allocating the stripped copy.
+    """
+    if not raw or raw[:1] == b'#' or raw.isspace():
+        return None
+    s = raw.strip()
+    if not s or s[:1] == b'#':
+        return None
+    return s
+
+
+def _read_raw_lines(file_path: Path) -> list:
+    """
+    Reads a file's lines as bytes: one syscall + one C-level line split via
+    mmap, instead of a Python readline iterator decoding line by line.
+    Empty files cannot be mapped, so that case falls back to a plain read.
+    """
+    with open(file_path, 'rb') as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return mm.read().splitlines()
+        except ValueError:
+            return f.read().splitlines()
+
+
+def _parse_kv_lines(raw_lines: list, file_name: str, log):
+    """
+    Yields (key, value) pairs parsed from raw byte lines, reporting
+    malformed lines through log(message) with their line numbers.
+    """
+    for line_num, raw_line in enumerate(raw_lines, 1):
+        raw = _useful(raw_line)
+        if raw is None:
+            continue
+        line = raw.decode('utf-8', errors='ignore')
+
+        # partition scans once; no separate "'=' in line" prescan
+        key, sep, value = line.partition('=')
+        if not sep:
+            log(f"Warning ({file_name}:{line_num}): Invalid line format (no equals sign found): '{line}'")
+            continue
+
+        key = key.strip()
+        value = value.strip()
+
+        # Remove quotes (single branch: matching pair of " or ')
+        if len(value) >= 2 and value[0] in ('"', "'") and value[-1] == value[0]:
+            value = value[1:-1]
+
+        if key:
+            yield key, value
+        else:
+            log(f"Warning ({file_name}:{line_num}): Invalid line format (no key found): '{line}'")
+
+
+def iter_key_value_pairs(file_path: Path, item_type: str = "settings", repo_name: str = None):
+    """
+    Streams parsed key-value pairs straight from the file buffer, for
+    callers that consume pairs one at a time (e.g. feeding subprocess
+    spawns) and don't need the intermediate dict that read_key_value_pairs
+    materializes. Read and parse errors propagate to the caller.
+
+    Args:
+        file_path (Path): The path to the file to read.
+        item_type (str): A label indicating the type of items in the file (for log messages, e.g., "secrets").
+        repo_name (str | None): The name of the repository related to this operation (None for global messages).
+
+    Yields:
+        tuple[str, str]: The parsed (key, value) pairs, in file order.
+    """
+    with batched_logs(repo_name) as _log:
+        _log(f"Reading {item_type} from file '{file_path.name}'...")
+        yield from _parse_kv_lines(_read_raw_lines(file_path), file_path.name, _log)
 
 
 def read_key_value_pairs(file_path: Path, item_type: str = "settings", repo_name: str = None) -> dict:
@@ -25,29 +132,11 @@ def read_key_value_pairs(file_path: Path, item_type: str = "settings", repo_name
 
     parsed_data = {}
     try:
-        add_log_entry(repo_name, f"Reading {item_type} from file '{file_path.name}'...")
-        with open(file_path.resolve(), 'rb') as f:
-            for line_num, raw_line in enumerate(f, 1):
-                line = raw_line.decode('utf-8', errors='ignore').strip()
-                if not line or line.startswith('#'):
-                    continue
-
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip()
-
-                    # Remove quotes
-                    if (value.startswith('"') and value.endswith('"')) or \
-                       (value.startswith("'") and value.endswith("'")):
-                        value = value[1:-1]
-
-                    if key:
-                        parsed_data[key] = value
-                    else:
-                        add_log_entry(repo_name, f"Warning ({file_path.name}:{line_num}): Invalid line format (no key found): '{line}'")
-                else:
-                    add_log_entry(repo_name, f"Warning ({file_path.name}:{line_num}): Invalid line format (no equals sign found): '{line}'")
+        # Batch all messages from the parse loop into one flush, so a file
+        # full of malformed lines does not pay a log interaction per line.
+        with batched_logs(repo_name) as _log:
+            _log(f"Reading {item_type} from file '{file_path.name}'...")
+            parsed_data = dict(_parse_kv_lines(_read_raw_lines(file_path), file_path.name, _log))
     except Exception as e:
         add_log_entry(repo_name, f"❌ Error: An unexpected error occurred while reading {item_type} file '{file_path.name}': {e}")
         return {}
@@ -77,8 +166,15 @@ def read_list_from_file(file_path: Path, list_type: str = "list", repo_name: str
         return []
 
     try:
-        with open(file_path.resolve(), 'r', encoding='utf-8') as f:
-            items = [line.strip() for line in f if line.strip() and not line.startswith('#')]
+        # One read + C-level line split; comments and blanks are dropped on
+        # raw bytes so only surviving items pay for a UTF-8 decode.
+        with open(file_path, 'rb') as f:
+            buf = f.read()
+        items = [
+            raw.decode('utf-8', errors='ignore')
+            for raw_line in buf.splitlines()
+            if (raw := _useful(raw_line)) is not None
+        ]
         add_log_entry(repo_name, f"✅ Read {len(items)} items from {list_type}: {file_path.name}")
         return items
     except Exception as e:
@@ -86,9 +182,17 @@ def read_list_from_file(file_path: Path, list_type: str = "list", repo_name: str
         return []
 
 
+# Successful validations keyed by path string -> (st_mtime_ns, Path).
+# Re-validating the same config file across repos then costs one stat and a
+# dict probe; entries are dropped when the file disappears or changes.
+_validated_path_cache: dict = {}
+
+
 def validate_file_path(path: Path, label: str, repo_name: str = None) -> Path | None:
     """
     Validates if the given path points to a valid file.
+    Successful results are cached by modification time, so repeated
+    validations of an unchanged file skip the file-type checks.
 
     Args:
         path (Path): The path to the file to validate.
@@ -101,25 +205,43 @@ def validate_file_path(path: Path, label: str, repo_name: str = None) -> Path |
     if path is None:
         return None
 
-    add_log_entry(repo_name, f"Validating file path: '{label}' path '{path}' (Type: {type(path).__name__})")
-
     try:
         if not isinstance(path, Path):
             add_log_entry(repo_name, f"❌ Error: Provided path for '{label}' is not a valid Path object: {path}")
             return None
-        if not path.exists():
+        # One stat call covers existence, file-ness and the cache key;
+        # resolve() (which walks symlinks) only runs for error messages.
+        key = os.fspath(path)
+        try:
+            st = os.stat(key)
+        except FileNotFoundError:
+            _validated_path_cache.pop(key, None)
             add_log_entry(repo_name, f"❌ Error: '{label}' file does not exist: {path.resolve()}")
             return None
-        if not path.is_file():
+
+        cached = _validated_path_cache.get(key)
+        if cached is not None and cached[0] == st.st_mtime_ns:
+            return cached[1]
+
+        if not stat.S_ISREG(st.st_mode):
             add_log_entry(repo_name, f"❌ Error: '{label}' path is a directory, not a file: {path.resolve()}")
             return None
+
+        _validated_path_cache[key] = (st.st_mtime_ns, path)
         return path
     except Exception as e:
         add_log_entry(repo_name, f"❌ Error: An exception occurred while processing '{label}' file ({path}): {e}")
         return None
 
 
-def execute_subprocess_command(command: list, shell: bool = False) -> tuple[str, str]:
+@lru_cache(maxsize=64)
+def _resolve_executable(name: str) -> str | None:
+    """Caches PATH lookups for external executables (e.g., 'gh') across invocations."""
+    return shutil.which(name)
+
+
+def execute_subprocess_command(command: list, shell: bool = False, decode: bool = True,
+                               allowed_returncodes: tuple = (0,)) -> tuple[str | bytes, str]:
     """
     Executes an external command and returns its standard output (stdout) and standard error (stderr).
     All log messages generated by this function are recorded as global logs (repo_name=None).
@@ -127,50 +249,174 @@ def execute_subprocess_command(command: list, shell: bool = False) -> tuple[str,
     Args:
         command (list): The command and its arguments to execute.
         shell (bool): Whether to execute the command through the shell. Defaults to False.
+        decode (bool): Whether to decode stdout to str. Pass False when the
+                       caller JSON-parses the output — the raw bytes go to the
+                       parser without an intermediate decoded copy. stderr is
+                       always decoded since it is only ever logged.
+        allowed_returncodes (tuple): Exit codes treated as success. Pass e.g.
+                                     (0, 1) for commands whose non-zero exit
+                                     means "no results" rather than an error,
+                                     skipping exception construction entirely.
 
     Returns:
-        tuple[str, str]: A tuple containing (stdout string, stderr string).
+        tuple[str | bytes, str]: A tuple containing (stdout, stderr string).
+                                 stdout is bytes when decode is False.
 
     Raises:
         subprocess.CalledProcessError: If the command returns a non-zero exit code.
-        FileNotFoundError: If the command executable is not found.
+        CommandNotFoundError: If the command executable is not found.
         Exception: For any other unexpected errors during command execution.
     """
-    cmd_str = ' '.join(command)
-    
-    try:
-        process = subprocess.run(
-            command,
-            shell=shell,
-            capture_output=True,
-            check=True
-        )
-        stdout_decoded = process.stdout.decode('utf-8', errors='replace').strip()
-        stderr_decoded = process.stderr.decode('utf-8', errors='replace').strip()
+    # Resolve the executable path once per binary instead of paying a PATH
+    # search on every invocation, and skip the fd-close loop at fork time.
+    if not shell:
+        resolved = _resolve_executable(command[0])
+        if resolved:
+            command = [resolved, *command[1:]]
 
-        return stdout_decoded, stderr_decoded
+    try:
+        # Popen + communicate with encoding= decodes the streams in the C
+        # layer once, instead of capture_output buffers plus a manual
+        # .decode() copy of each stream per call.
+        popen_kwargs = {
+            'shell': shell,
+            'stdout': subprocess.PIPE,
+            'stderr': subprocess.PIPE,
+            'close_fds': False,
+        }
+        if decode:
+            popen_kwargs['encoding'] = 'utf-8'
+            popen_kwargs['errors'] = 'replace'
+
+        process = subprocess.Popen(command, **popen_kwargs)
+        stdout_data, stderr_data = process.communicate()
+        if not decode:
+            stderr_data = stderr_data.decode('utf-8', errors='replace')
+        if process.returncode not in allowed_returncodes:
+            raise subprocess.CalledProcessError(
+                process.returncode, command, output=stdout_data, stderr=stderr_data
+            )
+
+        return stdout_data.strip(), stderr_data.strip()
 
     except subprocess.CalledProcessError as e:
-        error_stdout = e.stdout.decode('utf-8', errors='replace').strip() if e.stdout else ""
-        error_stderr = e.stderr.decode('utf-8', errors='replace').strip() if e.stderr else ""
-        
-        add_log_entry(None, f"❌ Command execution error: {cmd_str}")
+        error_stderr = e.stderr.strip() if e.stderr else ""
+
+        # The joined command string is only needed (and built) on failure
+        add_log_entry(None, f"❌ Command execution error: {' '.join(command)}")
         add_log_entry(None, f"❌ Stderr: {error_stderr}")
         raise # Re-raise the exception for the caller to handle
     except FileNotFoundError:
         add_log_entry(None, f"❌ Command failed: '{command[0]}' not found. Check your PATH.")
-        sys.exit(1) # Exiting the program is appropriate in this case
+        raise CommandNotFoundError(command[0]) from None # Let the caller decide whether this is fatal
     except Exception as e:
-        add_log_entry(None, f"❌ An unexpected error occurred during command execution ('{cmd_str}'): {e}")
+        add_log_entry(None, f"❌ An unexpected error occurred during command execution ('{' '.join(command)}'): {e}")
         raise
 
 
-def parse_json_string(json_string: str, error_context: str = "JSON parsing", repo_name: str = None):
+async def execute_subprocess_command_async(command: list) -> tuple[str, str]:
+    """
+    Async variant of execute_subprocess_command: awaits the subprocess so an
+    event loop can keep many gh invocations in flight at once. Does not
+    support shell=True (argument lists only).
+
+    Args:
+        command (list): The command and its arguments to execute.
+
+    Returns:
+        tuple[str, str]: A tuple containing (stdout string, stderr string).
+
+    Raises:
+        subprocess.CalledProcessError: If the command returns a non-zero exit code.
+    """
+    resolved = _resolve_executable(command[0])
+    if resolved:
+        command = [resolved, *command[1:]]
+
+    process = await asyncio.create_subprocess_exec(
+        *command,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    stdout_data, stderr_data = await process.communicate()
+    stdout_text = stdout_data.decode('utf-8', errors='replace').strip()
+    stderr_text = stderr_data.decode('utf-8', errors='replace').strip()
+
+    if process.returncode:
+        add_log_entry(None, f"❌ Command execution error: {' '.join(command)}")
+        add_log_entry(None, f"❌ Stderr: {stderr_text}")
+        raise subprocess.CalledProcessError(
+            process.returncode, command, output=stdout_text, stderr=stderr_text
+        )
+    return stdout_text, stderr_text
+
+
+async def run_many_subprocess_commands(commands: list, limit: int = 16) -> list:
+    """
+    Runs many commands concurrently on the event loop, at most `limit` at a
+    time, and returns their results in input order.
+
+    Args:
+        commands (list): A list of command argument lists.
+        limit (int): Maximum number of subprocesses in flight. Defaults to 16.
+
+    Returns:
+        list: One entry per command — a (stdout, stderr) tuple on success, or
+              the exception that command raised.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def _run_limited(command):
+        async with semaphore:
+            return await execute_subprocess_command_async(command)
+
+    return await asyncio.gather(
+        *(_run_limited(command) for command in commands),
+        return_exceptions=True
+    )
+
+
+def execute_subprocess_commands_batch(commands: list, concurrency: int = 8) -> list:
+    """
+    Executes multiple external commands concurrently and returns their results
+    in input order. Amortizes per-process spawn latency across the batch when
+    many independent CLI calls are needed at once.
+
+    Args:
+        commands (list): A list of command argument lists (as accepted by
+                         execute_subprocess_command).
+        concurrency (int): Maximum number of commands running at once. Defaults to 8.
+
+    Returns:
+        list: One entry per command — a (stdout, stderr) tuple on success, or
+              the exception that command raised. Callers decide per entry
+              whether a failure is fatal.
+    """
+    if not commands:
+        return []
+
+    results = [None] * len(commands)
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(commands))) as executor:
+        future_to_index = {
+            executor.submit(execute_subprocess_command, command): index
+            for index, command in enumerate(commands)
+        }
+        for future in as_completed(future_to_index):
+            index = future_to_index[future]
+            try:
+                results[index] = future.result()
+            except Exception as exc:
+                results[index] = exc
+    return results
+
+
+def parse_json_string(json_string: str | bytes, error_context: str = "JSON parsing", repo_name: str = None):
     """
     Parses a JSON string and returns the result.
 
     Args:
-        json_string (str): The JSON string to parse.
+        json_string (str | bytes): The JSON text to parse. Both parser
+                                   backends accept raw bytes directly.
         error_context (str): A description of the context for error messages (e.g., "repository secret list").
         repo_name (str | None): The name of the repository related to this operation (None for global messages).
 
@@ -178,7 +424,7 @@ def parse_json_string(json_string: str, error_context: str = "JSON parsing", rep
         any: The parsed JSON object (dict or list), or None if parsing fails.
     """
     try:
-        return json.loads(json_string)
+        return _json_loads(json_string)
     except json.JSONDecodeError as e:
         add_log_entry(repo_name, f"🚨 DEBUG: JSON parsing error! Context: {error_context}. Error: {e}")
         add_log_entry(repo_name, f"🚨 DEBUG: problematic_json_string: '''{json_string}'''")
@@ -188,6 +434,40 @@ def parse_json_string(json_string: str, error_context: str = "JSON parsing", rep
         return None
 
 
+class JsonPipeline:
+    """
+    Parses JSON off the calling thread so one response can be parsed while
+    the next command is being launched (orjson releases the GIL for large
+    payloads, so the stages genuinely overlap).
+
+    Usage:
+        pipeline = JsonPipeline()
+        future = pipeline.submit(stdout)
+        # ... launch the next command ...
+        data = future.result()
+    """
+
+    def __init__(self):
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="json-pipeline")
+
+    def submit(self, json_string, error_context: str = "JSON parsing", repo_name: str = None):
+        """
+        Schedules a parse job and returns its Future. The Future resolves to
+        the same result parse_json_string would return (None on parse errors).
+        """
+        return self._executor.submit(parse_json_string, json_string, error_context, repo_name)
+
+    def close(self):
+        """Shuts down the worker thread after pending parses finish."""
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
 def read_text_file_content(file_path: Path, repo_name: str = None) -> str:
     """
     Reads the entire content of a specified text file as a string.
@@ -204,12 +484,68 @@ def read_text_file_content(file_path: Path, repo_name: str = None) -> str:
         Exception: For any other file reading errors.
     """
     try:
-        with open(file_path.resolve(), 'r', encoding='utf-8') as f:
-            content = f.read().strip()
-        return content
+        # Read through a raw fd into one preallocated buffer, skipping the
+        # io stack's BufferedReader/TextIOWrapper layers and their per-call
+        # buffers — these files are small, so allocation is the cost here.
+        fd = os.open(os.fspath(file_path), os.O_RDONLY)
+        try:
+            size = os.fstat(fd).st_size
+            buf = bytearray(size)
+            view = memoryview(buf)
+            read = 0
+            while read < size:
+                if _HAS_READV:
+                    n = os.readv(fd, [view[read:]])
+                else:
+                    chunk = os.read(fd, size - read)
+                    n = len(chunk)
+                    view[read:read + n] = chunk
+                if n == 0:
+                    break
+                read += n
+        finally:
+            view.release()
+            os.close(fd)
+        if read != size:
+            del buf[read:]
+        return buf.decode('utf-8').strip()
     except FileNotFoundError:
         add_log_entry(repo_name, f"Error: File '{file_path.resolve()}' not found.")
         raise
     except Exception as e:
         add_log_entry(repo_name, f"Error: An unexpected error occurred while reading file '{file_path.resolve()}': {e}")
-        raise
\ No newline at end of file
+        raise
+
+
+def read_many_text_files(paths: list, concurrency: int = 16, repo_name: str = None) -> dict:
+    """
+    Reads many small text files concurrently and returns their contents,
+    overlapping the per-file open/read/close latency instead of paying it
+    serially at startup.
+
+    Args:
+        paths (list): The file paths to read.
+        concurrency (int): Maximum number of files read at once. Defaults to 16.
+        repo_name (str | None): The name of the repository related to this operation (None for global messages).
+
+    Returns:
+        dict: {path: content} for the files that were read successfully;
+              failed files are omitted (each failure is logged by
+              read_text_file_content).
+    """
+    if not paths:
+        return {}
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(paths))) as executor:
+        future_to_path = {
+            executor.submit(read_text_file_content, path, repo_name): path
+            for path in paths
+        }
+        for future in as_completed(future_to_path):
+            path = future_to_path[future]
+            try:
+                results[path] = future.result()
+            except Exception:
+                continue  # Already logged by read_text_file_content
+    return results
\ No newline at end of file